@@ -6,8 +6,10 @@ __all__ = (
     "__version__",
     "check_code",
     "check_file",
+    "check_files",
     "check_stream",
     "code",
+    "codes",
     "file",
     "find_imports_in_code",
     "find_imports_in_file",
@@ -19,12 +21,12 @@ __all__ = (
     "stream",
 )
 
-from . import settings
-from ._version import __version__
+from . import _version, settings
 from .api import ImportKey
 from .api import check_code_string as check_code
 from .api import (
     check_file,
+    check_files,
     check_stream,
     find_imports_in_code,
     find_imports_in_file,
@@ -34,6 +36,9 @@ from .api import (
     place_module_with_reason,
 )
 from .api import sort_code_string as code
+from .api import sort_code_strings as codes
 from .api import sort_file as file
 from .api import sort_stream as stream
 from .settings import Config
+
+__version__: str = _version.get_version()
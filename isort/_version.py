@@ -1,5 +1,18 @@
-from importlib import metadata
+"""Provides the version of isort, looked up once from the installed package's metadata."""
+
+from functools import lru_cache
 
-__version__ = metadata.version("isort")
 _IS_COMPILED = __file__.endswith((".so", ".pyd"))
-_VERSION_STRING = f"{__version__} (compiled {'yes' if _IS_COMPILED else 'no'})"
+
+
+@lru_cache(maxsize=1)
+def get_version() -> str:
+    """Returns the installed version of isort."""
+    from importlib import metadata  # noqa: PLC0415
+
+    return metadata.version("isort")
+
+
+def get_version_string() -> str:
+    """Returns the installed version of isort, along with whether it was compiled."""
+    return f"{get_version()} (compiled {'yes' if _IS_COMPILED else 'no'})"
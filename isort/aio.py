@@ -0,0 +1,167 @@
+"""Provides asyncio friendly equivalents of isort's code string API, for services that sort many
+snippets of code concurrently without blocking their event loop.
+
+    async with Sorter(profile="black") as sorter:
+        sorted_codes = await asyncio.gather(*(sorter.sort_code_string(code) for code in codes))
+
+Work is spread over a pool of worker processes, or threads, which are each sent the configuration
+once when started rather than along with every call. Every call made to a worker then uses that
+same configuration, keeping the caches built for it, such as where modules are placed, warm.
+"""
+
+import asyncio
+import os
+from collections.abc import Callable
+from concurrent.futures import Executor
+from functools import partial
+from pathlib import Path
+from types import TracebackType
+from typing import Any
+
+from . import api, identify
+from .api import ImportKey
+from .settings import DEFAULT_CONFIG, Config
+
+_process_worker: dict[str, "_Worker"] = {}
+
+
+class Sorter:
+    """Sorts, checks and finds imports in code strings from asyncio code, using a managed pool of
+    workers.
+
+    - **config**: The config object to use, alternatively pass in config options as kwargs.
+    - **workers**: The number of worker processes or threads. Defaults to the number of CPUs.
+    - **max_concurrency**: The maximum number of calls handed to the workers at once, further
+        calls wait for one of those to finish. Defaults to twice the number of workers.
+    - **use_threads**: Use threads rather than processes. Threads start faster and share the
+        caches of the calling process, but don't sort code in parallel.
+    - ****config_kwargs**: Any config modifications.
+    """
+
+    def __init__(
+        self,
+        config: Config = DEFAULT_CONFIG,
+        workers: int | None = None,
+        max_concurrency: int | None = None,
+        use_threads: bool = False,
+        **config_kwargs: Any,
+    ) -> None:
+        self.config = api._config(config=config, **config_kwargs)
+        self.workers = workers or os.cpu_count() or 1
+        self.max_concurrency = max_concurrency or 2 * self.workers
+        self.use_threads = use_threads
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._executor: Executor | None = None
+        self._thread_worker = _Worker(self.config)
+
+    async def sort_code_string(
+        self,
+        code: str,
+        extension: str | None = None,
+        file_path: Path | None = None,
+        disregard_skip: bool = False,
+    ) -> str:
+        """Sorts any imports within the provided code string, returning a new string with them
+        sorted. See `isort.api.sort_code_string`.
+        """
+        result: str = await self._run(
+            "sort_code_string",
+            code,
+            extension=extension,
+            file_path=file_path,
+            disregard_skip=disregard_skip,
+        )
+        return result
+
+    async def check_code_string(
+        self,
+        code: str,
+        extension: str | None = None,
+        file_path: Path | None = None,
+        disregard_skip: bool = False,
+    ) -> bool:
+        """Checks the order, format, and categorization of imports within the provided code
+        string. See `isort.api.check_code_string`.
+        """
+        result: bool = await self._run(
+            "check_code_string",
+            code,
+            extension=extension,
+            file_path=file_path,
+            disregard_skip=disregard_skip,
+        )
+        return result
+
+    async def find_imports_in_code(
+        self,
+        code: str,
+        file_path: Path | None = None,
+        unique: bool | ImportKey = False,
+        top_only: bool = False,
+    ) -> list[identify.Import]:
+        """Finds and returns all imports within the provided code string. See
+        `isort.api.find_imports_in_code`.
+        """
+        result: list[identify.Import] = await self._run(
+            "find_imports_in_code", code, file_path=file_path, unique=unique, top_only=top_only
+        )
+        return result
+
+    def close(self) -> None:
+        """Shuts the workers down, waiting for any calls still in progress."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    async def __aenter__(self) -> "Sorter":
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        await asyncio.to_thread(self.close)
+
+    async def _run(self, function_name: str, code: str, **kwargs: Any) -> Any:
+        async with self._semaphore:
+            return await asyncio.get_running_loop().run_in_executor(
+                self._get_executor(), partial(self._call, function_name, code, **kwargs)
+            )
+
+    @property
+    def _call(self) -> Callable[..., Any]:
+        return self._thread_worker.call if self.use_threads else _call_in_process
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self.use_threads:
+                from concurrent.futures import ThreadPoolExecutor  # noqa: PLC0415
+
+                self._executor = ThreadPoolExecutor(self.workers)
+            else:
+                from concurrent.futures import ProcessPoolExecutor  # noqa: PLC0415
+
+                self._executor = ProcessPoolExecutor(
+                    self.workers, initializer=_init_process, initargs=(self.config,)
+                )
+        return self._executor
+
+
+class _Worker:
+    def __init__(self, config: Config) -> None:
+        self.config = config
+
+    def call(self, function_name: str, code: str, **kwargs: Any) -> Any:
+        if function_name == "find_imports_in_code":
+            return list(api.find_imports_in_code(code, config=self.config, **kwargs))
+        return getattr(api, function_name)(code, config=self.config, **kwargs)
+
+
+def _init_process(config: Config) -> None:
+    _process_worker["worker"] = _Worker(config)
+
+
+def _call_in_process(function_name: str, code: str, **kwargs: Any) -> Any:
+    return _process_worker["worker"].call(function_name, code, **kwargs)
@@ -2,6 +2,7 @@ __all__ = (
     "ImportKey",
     "check_code_string",
     "check_file",
+    "check_files",
     "check_stream",
     "find_imports_in_code",
     "find_imports_in_file",
@@ -10,15 +11,18 @@ __all__ = (
     "place_module",
     "place_module_with_reason",
     "sort_code_string",
+    "sort_code_strings",
     "sort_file",
     "sort_stream",
 )
 
+import codecs
 import contextlib
+import mmap
 import os
 import shutil
 import sys
-from collections.abc import Iterator
+from collections.abc import Callable, Iterable, Iterator
 from contextlib import AbstractContextManager, nullcontext
 from enum import Enum
 from io import StringIO
@@ -30,10 +34,11 @@ from warnings import warn
 
 from isort import core
 
-from . import files, identify, io
+from . import cache, files, identify, io, profiling
 from .exceptions import (
     ExistingSyntaxErrors,
     FileSkipComment,
+    FileSkipped,
     FileSkipSetting,
     IntroducedSyntaxErrors,
 )
@@ -190,7 +195,9 @@ def sort_stream(
     if config.atomic:
         try:
             file_content = input_stream.read()
+            started = profiling.start()
             compile(file_content, content_source, "exec", flags=0, dont_inherit=True)
+            profiling.stop("compile", started)
         except SyntaxError:
             if extension not in CYTHON_EXTENSIONS:
                 raise ExistingSyntaxErrors(content_source)
@@ -218,7 +225,9 @@ def sort_stream(
     if config.atomic:
         _internal_output.seek(0)
         try:
+            started = profiling.start()
             compile(_internal_output.read(), content_source, "exec", flags=0, dont_inherit=True)
+            profiling.stop("compile", started)
             _internal_output.seek(0)
         except SyntaxError:  # pragma: no cover
             if extension not in CYTHON_EXTENSIONS:
@@ -328,22 +337,70 @@ def check_file(
     if "config_trie" in config_kwargs:
         config_trie = config_kwargs.pop("config_trie", None)
         if config_trie:
-            config_info = config_trie.search(filename)
+            started = profiling.start()
+            config_path, file_config = config_trie.search_config(str(filename))
+            profiling.stop("config", started)
             if config.verbose:
-                print(f"{config_info[0]} used for file {filename}")
-
-            file_config = Config(**config_info[1])
+                print(f"{config_path} used for file {filename}")
 
     with io.File.read(filename) as source_file:
-        return check_stream(
+        actual_file_path = file_path or source_file.path
+        config = _config(path=actual_file_path, config=file_config, **config_kwargs)
+
+        cache_key = None
+        if disregard_skip and config.use_cache:
+            cache_key = cache.file_key(source_file.path, config, extension)
+        if disregard_skip and (
+            _nothing_to_sort(source_file, config)
+            or (cache_key and cache.is_sorted(cache_key, config))
+        ):
+            if config.verbose and not config.only_modified:
+                create_terminal_printer(
+                    color=config.color_output,
+                    error=config.format_error,
+                    success=config.format_success,
+                ).success(f"{actual_file_path} Everything Looks Good!")
+            return True
+
+        is_sorted = check_stream(
             source_file.stream,
             show_diff=show_diff,
             extension=extension,
-            config=file_config,
-            file_path=file_path or source_file.path,
+            config=config,
+            file_path=actual_file_path,
             disregard_skip=disregard_skip,
-            **config_kwargs,
         )
+        if is_sorted and cache_key:
+            cache.mark_sorted(cache_key, config)
+        return is_sorted
+
+
+# Encodings in which the tokens below are guaranteed to appear as their ASCII bytes.
+_ASCII_COMPATIBLE_ENCODINGS = frozenset(("ascii", "utf-8", "utf-8-sig", "iso8859-1", "cp1252"))
+
+
+def _nothing_to_sort(source_file: File, config: Config) -> bool:
+    """Returns `True` if the raw contents of the file prove sorting it can't change anything,
+    which is the case when it has no imports, no action comments and nothing else to sort.
+    """
+    if (config.add_imports and not config.append_only) or config.atomic:
+        return False
+    if codecs.lookup(source_file.encoding).name not in _ASCII_COMPATIBLE_ENCODINGS:
+        return False
+
+    tokens = [b"import", b"isort"]
+    if config.sort_reexports:
+        tokens.append(b"__all__")
+    try:
+        with (
+            source_file.path.open("rb") as raw_file,
+            mmap.mmap(raw_file.fileno(), 0, access=mmap.ACCESS_READ) as contents,
+        ):
+            return all(contents.find(token) == -1 for token in tokens)
+    except ValueError:  # Empty files can't be mapped, and have nothing to sort.
+        return True
+    except OSError:
+        return False
 
 
 @contextlib.contextmanager
@@ -353,14 +410,18 @@ def _in_memory_output_stream_context(source_file: File, changed: Event) -> Itera
 
     If `changed` is set at exit it will copy the stream to the source file.
     """
+    started = profiling.start()
     stream = StringIO(newline=None)
+    profiling.stop("write", started)
     yield stream
 
+    started = profiling.start()
     if changed.is_set():
         stream.seek(0)
         source_file.stream.close()
         with source_file.path.open("w") as fs:
             shutil.copyfileobj(stream, fs)
+    profiling.stop("write", started, calls=0)
 
 
 @contextlib.contextmanager
@@ -375,13 +436,17 @@ def _file_output_stream_context(
     tmp_file = source_file.path.with_suffix(source_file.path.suffix + ".isorted")
 
     try:
+        started = profiling.start()
         with tmp_file.open("w+", encoding=source_file.encoding, newline="") as output_stream:
             shutil.copymode(filename, tmp_file)
+            profiling.stop("write", started)
             yield output_stream
+            started = profiling.start()
 
         if changed.is_set():
             source_file.stream.close()
             tmp_file.replace(source_file.path)
+        profiling.stop("write", started, calls=0)
     finally:
         # Make sure to remove the temporary file, whatever is the outcoming of sorting.
         tmp_file.unlink(missing_ok=True)
@@ -423,11 +488,11 @@ def sort_file(
     if "config_trie" in config_kwargs:
         config_trie = config_kwargs.pop("config_trie", None)
         if config_trie:
-            config_info = config_trie.search(filename)
+            started = profiling.start()
+            config_path, file_config = config_trie.search_config(str(filename))
+            profiling.stop("config", started)
             if config.verbose:
-                print(f"{config_info[0]} used for file {filename}")
-
-            file_config = Config(**config_info[1])
+                print(f"{config_path} used for file {filename}")
 
     with io.File.read(filename) as source_file:
         actual_file_path = file_path or source_file.path
@@ -439,6 +504,18 @@ def sort_file(
         # Prepare the output stream. Using the `is_changed_event` we propagate whether the file
         # should flush the output to the source file.
         is_changed_event = Event()
+        # Files that can't contain anything to sort, or that were previously found to be sorted
+        # with the same config, can be skipped entirely, as long as their content doesn't need
+        # to be echoed to an output stream.
+        cache_key = None
+        if disregard_skip and not output:
+            if _nothing_to_sort(source_file, config):
+                return False
+            if config.use_cache:
+                cache_key = cache.file_key(source_file.path, config, extension)
+                if cache_key and cache.is_sorted(cache_key, config):
+                    return False
+
         if output:
             output_stream_context: AbstractContextManager[TextIO] = nullcontext(output)
         elif config.overwrite_in_place:
@@ -471,6 +548,9 @@ def sort_file(
                 )
                 return False
 
+            if not changed and cache_key:
+                cache.mark_sorted(cache_key, config)
+
             if not changed or write_to_stdout:
                 return changed
 
@@ -628,9 +708,199 @@ def find_imports_in_paths(
     )
 
 
+def sort_code_strings(
+    items: Iterable[tuple[str, Path | None]],
+    extension: str | None = None,
+    config: Config = DEFAULT_CONFIG,
+    disregard_skip: bool = False,
+    jobs: int | None = 1,
+    ordered: bool = True,
+    **config_kwargs: Any,
+) -> Iterator[tuple[int, str]]:
+    """Sorts the imports within many code strings, lazily yielding the index of each item
+    alongside its sorted code. Produces the same results as calling `sort_code_string` for each
+    item, while only resolving the configuration once for the whole batch, or once per directory
+    when it is looked up from the file paths.
+
+    - **items**: Pairs of code and the disk location it was pulled from, or `None`.
+    - **extension**: The file extension that contains imports. Defaults to filename extension or py.
+    - **config**: The config object to use when sorting imports.
+    - **disregard_skip**: set to `True` if you want to ignore a skip set in config for this file.
+    - **jobs**: The number of processes to sort code in, or `None` for one per CPU. Code is sorted
+      within the current process by default.
+    - **ordered**: set to `False` to yield results as soon as they are ready, rather than in the
+      order of the items.
+    - ****config_kwargs**: Any config modifications.
+
+    Skipped code is yielded unchanged.
+    """
+    yield from _run_batch(
+        _sort_batch_item,
+        ((index, *item) for index, item in enumerate(items)),
+        _batch_options(config, config_kwargs, extension, disregard_skip),
+        jobs,
+        ordered,
+    )
+
+
+def check_files(
+    filenames: Iterable[str | Path],
+    config: Config = DEFAULT_CONFIG,
+    disregard_skip: bool = True,
+    extension: str | None = None,
+    jobs: int | None = 1,
+    ordered: bool = True,
+    **config_kwargs: Any,
+) -> Iterator[tuple[str | Path, bool]]:
+    """Checks the imports within many files, lazily yielding each file name alongside `True` if
+    no problems are identified, otherwise `False`. Produces the same results as calling
+    `check_file` for each file, while only resolving the configuration once for the whole batch,
+    or once per directory when it is looked up from the file paths.
+
+    - **filenames**: The names or Paths of the files to check.
+    - **config**: The config object to use when sorting imports.
+    - **disregard_skip**: set to `True` if you want to ignore a skip set in config for this file.
+    - **extension**: The file extension that contains imports. Defaults to filename extension or py.
+    - **jobs**: The number of processes to check files in, or `None` for one per CPU. Files are
+      checked within the current process by default.
+    - **ordered**: set to `False` to yield results as soon as they are ready, rather than in the
+      order of the file names.
+    - ****config_kwargs**: Any config modifications.
+
+    Skipped files are reported as correctly sorted.
+    """
+    yield from _run_batch(
+        _check_batch_item,
+        filenames,
+        _batch_options(config, config_kwargs, extension, disregard_skip),
+        jobs,
+        ordered,
+    )
+
+
+class _Batch:
+    """The state shared by every item of a batch, resolved once rather than for every item."""
+
+    def __init__(
+        self,
+        config: Config,
+        config_per_directory: bool,
+        config_kwargs: dict[str, Any],
+        extension: str | None,
+        disregard_skip: bool,
+    ) -> None:
+        self.config = config
+        self.config_per_directory = config_per_directory
+        self.config_kwargs = config_kwargs
+        self.extension = extension
+        self.disregard_skip = disregard_skip
+        self.configs_by_directory: dict[Path, Config] = {}
+        self.output_stream = StringIO()
+
+    def config_for(self, file_path: Path | None) -> Config:
+        if not (self.config_per_directory and file_path):
+            return self.config
+
+        directory = file_path.parent
+        if directory not in self.configs_by_directory:
+            self.configs_by_directory[directory] = _config(
+                path=file_path, config=DEFAULT_CONFIG, **self.config_kwargs
+            )
+        return self.configs_by_directory[directory]
+
+
+def _batch_options(
+    config: Config, config_kwargs: dict[str, Any], extension: str | None, disregard_skip: bool
+) -> dict[str, Any]:
+    # The configuration is resolved here, before any worker processes are started, so that
+    # invalid configuration raises to the caller rather than failing every worker as it starts.
+    return {
+        "config": _config(config=config, **config_kwargs),
+        # Like the single item functions, configuration is looked up from the file paths unless
+        # given, though only once per directory.
+        "config_per_directory": (
+            config is DEFAULT_CONFIG
+            and "settings_path" not in config_kwargs
+            and "settings_file" not in config_kwargs
+        ),
+        "config_kwargs": config_kwargs,
+        "extension": extension,
+        "disregard_skip": disregard_skip,
+    }
+
+
+def _sort_batch_item(batch: _Batch, item: tuple[int, str, Path | None]) -> tuple[int, str]:
+    index, code, file_path = item
+    output_stream = batch.output_stream
+    output_stream.seek(0)
+    output_stream.truncate()
+    try:
+        sort_stream(
+            StringIO(code),
+            output_stream,
+            extension=batch.extension,
+            config=batch.config_for(file_path),
+            file_path=file_path,
+            disregard_skip=batch.disregard_skip,
+        )
+    except FileSkipped:
+        return index, code
+    return index, output_stream.getvalue()
+
+
+def _check_batch_item(batch: _Batch, filename: str | Path) -> tuple[str | Path, bool]:
+    try:
+        return filename, check_file(
+            filename,
+            config=batch.config_for(Path(filename)),
+            disregard_skip=batch.disregard_skip,
+            extension=batch.extension,
+        )
+    except FileSkipped:
+        return filename, True
+
+
+_batch_worker: dict[str, Any] = {}
+
+
+def _run_batch(
+    function: Callable[[_Batch, Any], Any],
+    items: Iterable[Any],
+    batch_options: dict[str, Any],
+    jobs: int | None,
+    ordered: bool,
+) -> Iterator[Any]:
+    if jobs == 1:
+        batch = _Batch(**batch_options)
+        for item in items:
+            yield function(batch, item)
+        return
+
+    import multiprocessing.pool  # noqa: PLC0415
+
+    # Each worker resolves the shared state once, rather than it being sent along with every item.
+    with multiprocessing.pool.Pool(
+        jobs, initializer=_init_batch_worker, initargs=(function, batch_options)
+    ) as pool:
+        run = pool.imap if ordered else pool.imap_unordered
+        yield from run(_run_batch_item, items, chunksize=16)
+
+
+def _init_batch_worker(
+    function: Callable[[_Batch, Any], Any], batch_options: dict[str, Any]
+) -> None:
+    _batch_worker["batch"] = _Batch(**batch_options)
+    _batch_worker["function"] = function
+
+
+def _run_batch_item(item: Any) -> Any:
+    return _batch_worker["function"](_batch_worker["batch"], item)
+
+
 def _config(
     path: Path | None = None, config: Config = DEFAULT_CONFIG, **config_kwargs: Any
 ) -> Config:
+    started = profiling.start()
     if path and (
         config is DEFAULT_CONFIG
         and "settings_path" not in config_kwargs
@@ -647,4 +917,5 @@ def _config(
 
         config = Config(**config_kwargs)
 
+    profiling.stop("config", started)
     return config
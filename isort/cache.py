@@ -0,0 +1,133 @@
+"""Defines isort's persistent cache of source files that are already correctly sorted.
+
+Entries are keyed by a hash of a file's raw contents combined with a fingerprint of the effective
+configuration, the running isort version and the packages and modules found directly within the
+configured `src_paths`, so changing any of those automatically invalidates them. Placement that
+depends on other files isn't tracked, such as whether a nested package is a namespace package,
+so the cache directory needs clearing after changing those. Every entry is an empty marker file,
+which can be created and removed atomically, making the cache safe to share between concurrently
+running isort processes.
+"""
+
+import hashlib
+import os
+import sys
+import time
+from pathlib import Path
+
+from . import _version, place
+from .settings import Config
+
+# Pruning looks at every entry, which takes far longer than checking a few files does, so runs
+# only prune once this many seconds have passed since the cache was last pruned.
+PRUNE_INTERVAL_SECONDS = 60 * 60
+
+
+def default_directory() -> Path:
+    """Returns the per-user directory the cache is stored in when `cache_dir` isn't set."""
+    if sys.platform == "win32":  # pragma: no cover
+        base = os.environ.get("LOCALAPPDATA") or os.path.expanduser("~/AppData/Local")
+    elif sys.platform == "darwin":  # pragma: no cover
+        base = os.path.expanduser("~/Library/Caches")
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache")
+    return Path(base) / "isort"
+
+
+def directory(config: Config) -> Path:
+    """Returns the directory the cache is stored in for the given config."""
+    return Path(config.cache_dir) if config.cache_dir else default_directory()
+
+
+def file_key(file_path: Path, config: Config, extension: str | None = None) -> str | None:
+    """Returns the cache key for the current contents of the given file, or `None` if it can't
+    be read.
+    """
+    try:
+        contents = file_path.read_bytes()
+    except OSError:
+        return None
+
+    extension = extension or file_path.suffix.lstrip(".") or "py"
+    key = hashlib.sha256()
+    for part in (
+        _version.get_version(),
+        config.digest,
+        place.src_paths_fingerprint(config),
+        extension,
+    ):
+        key.update(part.encode("utf-8"))
+        key.update(b"\0")
+    key.update(contents)
+    return key.hexdigest()
+
+
+def _entry(key: str, config: Config) -> Path:
+    return directory(config) / key[:2] / key
+
+
+def is_sorted(key: str, config: Config) -> bool:
+    """Returns `True` if contents with the given key were previously found to be sorted."""
+    entry = _entry(key, config)
+    try:
+        # Refresh the entry so that pruning evicts the least recently used entries first.
+        os.utime(entry)
+    except OSError:
+        return False
+    return True
+
+
+def mark_sorted(key: str, config: Config) -> None:
+    """Records that contents with the given key are correctly sorted."""
+    entry = _entry(key, config)
+    try:
+        entry.parent.mkdir(parents=True, exist_ok=True)
+        entry.touch()
+    except OSError:  # pragma: no cover
+        pass
+
+
+def prune(config: Config) -> None:
+    """Removes the least recently used entries until at most `cache_max_entries` remain."""
+    entries: list[tuple[float, str]] = []
+    try:
+        with os.scandir(directory(config)) as buckets:
+            for bucket in buckets:
+                if not bucket.is_dir(follow_symlinks=False):
+                    continue
+                with os.scandir(bucket.path) as bucket_entries:
+                    entries.extend(
+                        (entry.stat().st_mtime, entry.path)
+                        for entry in bucket_entries
+                        if entry.is_file(follow_symlinks=False)
+                    )
+    except OSError:
+        return
+
+    if len(entries) <= config.cache_max_entries:
+        return
+
+    entries.sort()
+    for _, entry_path in entries[: len(entries) - config.cache_max_entries]:
+        try:
+            os.remove(entry_path)
+        except OSError:  # pragma: no cover - another process may have removed it already
+            pass
+
+
+def prune_if_due(config: Config) -> None:
+    """Prunes the cache, unless it was already pruned within the last `PRUNE_INTERVAL_SECONDS`."""
+    marker = directory(config) / "last-pruned"
+    try:
+        if time.time() - marker.stat().st_mtime < PRUNE_INTERVAL_SECONDS:
+            return
+    except OSError:
+        pass
+
+    try:
+        # Marked before pruning, so that concurrently running processes don't all prune at once.
+        marker.parent.mkdir(parents=True, exist_ok=True)
+        marker.touch()
+    except OSError:  # pragma: no cover
+        return
+    prune(config)
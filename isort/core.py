@@ -1,9 +1,10 @@
 import textwrap
-from io import StringIO
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from functools import lru_cache, partial
 from itertools import chain
 from typing import TextIO
 
-import isort.literal
 from isort.settings import DEFAULT_CONFIG, Config
 
 from . import output, parse
@@ -64,8 +65,8 @@ def process(
     was provided in the input_stream, otherwise `False`.
     """
     line_separator: str = config.line_ending
-    add_imports: list[str] = [format_natural(addition) for addition in config.add_imports]
-    import_section: str = ""
+    add_imports: list[str] = list(_formatted_add_imports(config))
+    import_section_lines: list[str] = []
     next_import_section: str = ""
     next_cimports: bool = False
     in_quote: str = ""
@@ -79,7 +80,7 @@ def process(
     isort_off: bool = False
     skip_file: bool = False
     code_sorting: bool | str = False
-    code_sorting_section: str = ""
+    code_sorting_section: list[str] = []
     code_sorting_indent: str = ""
     cimports: bool = False
     made_changes: bool = False
@@ -89,17 +90,19 @@ def process(
     lines_before: list[str] = []
     is_reexport: bool = False
     reexport_rollback: int = 0
+    input_lines: Iterable[str] = input_stream
+    readline: Callable[[], str] = input_stream.readline
 
     if config.float_to_top:
-        new_input = ""
-        current = ""
+        new_input: deque[str] = deque()
+        current: list[str] = []
         isort_off = False
         for line in chain(input_stream, (None,)):
             stripped_line = line.strip() if line is not None else ""
             if isort_off and line is not None:
                 if stripped_line == "# isort: on":
                     isort_off = False
-                new_input += line
+                new_input.append(line)
             elif (
                 line is None
                 or stripped_line in ("# isort: split", "# isort: off")
@@ -108,18 +111,16 @@ def process(
                 if stripped_line == "# isort: off":
                     isort_off = True
                 if current:
-                    before = current
+                    before = "".join(current)
                     if add_imports:
                         add_line_separator = line_separator or "\n"
-                        current += add_line_separator + add_line_separator.join(add_imports)
+                        current.append(add_line_separator + add_line_separator.join(add_imports))
                         add_imports = []
-                    parsed = parse.file_contents(current, config=config)
+                    parsed = parse.file_contents("".join(current), config=config)
                     verbose_output += parsed.verbose_output
-                    extra_space = ""
-                    while before and before[-1] == "\n":
-                        extra_space += "\n"
-                        before = before[:-1]
-                    extra_space = extra_space.replace("\n", "", 1)
+                    trailing_newlines = len(before) - len(before.rstrip("\n"))
+                    before = before[: len(before) - trailing_newlines]
+                    extra_space = "\n" * max(trailing_newlines - 1, 0)
                     sorted_output = output.sorted_imports(
                         parsed, config, extension, import_type="import"
                     )
@@ -129,16 +130,19 @@ def process(
                         line_separator=parsed.line_separator,
                         ignore_whitespace=config.ignore_whitespace,
                     )
-                    new_input += sorted_output
-                    new_input += extra_space
-                    current = ""
-                new_input += line or ""
+                    new_input.append(sorted_output)
+                    new_input.append(extra_space)
+                    current = []
+                new_input.append(line or "")
             else:
-                current += line or ""
+                current.append(line)
 
-        input_stream = StringIO(new_input)
+        # Feed the floated code into the main loop line by line, rather than joining it into a
+        # second copy of the whole file.
+        input_lines = _lines(new_input)
+        readline = partial(next, input_lines, "")
 
-    for index, line in enumerate(chain(input_stream, (None,))):
+    for index, line in enumerate(chain(input_lines, (None,))):
         if line is None:
             if index == 0 and not config.force_adds:
                 return False
@@ -156,9 +160,12 @@ def process(
                     # and raise ValueError. See PR #2576.
                     output_stream.seek(max(0, output_stream.tell() - reexport_rollback))
                     reexport_rollback = 0
+                from . import literal  # noqa: PLC0415
+
+                code_to_sort = "".join(code_sorting_section)
                 sorted_code = textwrap.indent(
-                    isort.literal.assignment(
-                        code_sorting_section,
+                    literal.assignment(
+                        code_to_sort,
                         str(code_sorting),
                         extension,
                         config=_indented_config(config, indent),
@@ -166,7 +173,7 @@ def process(
                     code_sorting_indent,
                 )
                 made_changes = made_changes or _has_changed(
-                    before=code_sorting_section,
+                    before=code_to_sort,
                     after=sorted_code,
                     line_separator=line_separator,
                     ignore_whitespace=config.ignore_whitespace,
@@ -267,14 +274,17 @@ def process(
                     code_sorting = LITERAL_TYPE_MAPPING.get(rhs.lstrip()[0], "tuple")
                     code_sorting_indent = line[: -len(line.lstrip())]
                     not_imports = True
-                    code_sorting_section += line
+                    code_sorting_section.append(line)
                     reexport_rollback = len(line)
                     is_reexport = True
                 elif code_sorting:
                     if not stripped_line:
+                        from . import literal  # noqa: PLC0415
+
+                        code_to_sort = "".join(code_sorting_section)
                         sorted_code = textwrap.indent(
-                            isort.literal.assignment(
-                                code_sorting_section,
+                            literal.assignment(
+                                code_to_sort,
                                 str(code_sorting),
                                 extension,
                                 config=_indented_config(config, indent),
@@ -282,7 +292,7 @@ def process(
                             code_sorting_indent,
                         )
                         made_changes = made_changes or _has_changed(
-                            before=code_sorting_section,
+                            before=code_to_sort,
                             after=sorted_code,
                             line_separator=line_separator,
                             ignore_whitespace=config.ignore_whitespace,
@@ -303,22 +313,22 @@ def process(
                             output_stream.truncate()
                         not_imports = True
                         code_sorting = False
-                        code_sorting_section = ""
+                        code_sorting_section = []
                         code_sorting_indent = ""
                         is_reexport = False
                     else:
-                        code_sorting_section += line
+                        code_sorting_section.append(line)
                         line = ""
                 elif (
                     stripped_line in config.section_comments
                     or stripped_line in config.section_comments_end
                 ):
-                    if import_section and not contains_imports:
-                        output_stream.write(import_section)
-                        import_section = line
+                    if import_section_lines and not contains_imports:
+                        output_stream.write("".join(import_section_lines))
+                        import_section_lines = [line]
                         not_imports = False
                     else:
-                        import_section += line
+                        import_section_lines.append(line)
                     indent = line[: -len(line.lstrip())]
                 elif not (stripped_line or contains_imports):
                     not_imports = True
@@ -328,28 +338,29 @@ def process(
                     and not config.treat_all_comments_as_code
                     and stripped_line not in config.treat_comments_as_code
                 ):
-                    import_section += line
+                    import_section_lines.append(line)
                 elif stripped_line.startswith(IMPORT_START_IDENTIFIERS):
                     new_indent = line[: -len(line.lstrip())]
-                    import_statement = line
+                    import_statement_lines = [line]
                     stripped_line = line.strip().split("#")[0]
                     while stripped_line.endswith("\\") or (
                         "(" in stripped_line and ")" not in stripped_line
                     ):
                         if stripped_line.endswith("\\"):
                             while stripped_line and stripped_line.endswith("\\"):
-                                line = input_stream.readline()
+                                line = readline()
                                 stripped_line = line.strip().split("#")[0]
-                                import_statement += line
+                                import_statement_lines.append(line)
                         else:
                             while ")" not in stripped_line:
-                                line = input_stream.readline()
+                                line = readline()
 
                                 if not line:  # end of file without closing parenthesis
                                     raise ExistingSyntaxErrors("Parenthesis is not closed")
 
                                 stripped_line = line.strip().split("#")[0]
-                                import_statement += line
+                                import_statement_lines.append(line)
+                    import_statement = "".join(import_statement_lines)
 
                     # The second clause keeps a per-line ``isort: skip`` import exactly
                     # where it is: when earlier imports have already been collected into
@@ -383,11 +394,11 @@ def process(
 
                         if cimport_statement != cimports or (
                             new_indent != indent
-                            and import_section
+                            and import_section_lines
                             and (not did_contain_imports or len(new_indent) < len(indent))
                         ):
                             indent = new_indent
-                            if import_section:
+                            if import_section_lines:
                                 next_cimports = cimport_statement
                                 next_import_section = import_statement
                                 import_statement = ""
@@ -397,11 +408,12 @@ def process(
                                 cimports = cimport_statement
                         else:
                             if new_indent != indent:
-                                if import_section and did_contain_imports:
+                                if import_section_lines and did_contain_imports:
                                     import_statement = indent + import_statement.lstrip()
                                 else:
                                     indent = new_indent
-                        import_section += import_statement
+                        if import_statement:
+                            import_section_lines.append(import_statement)
                 else:
                     not_imports = True
 
@@ -411,12 +423,13 @@ def process(
                 if line.strip() == "" and not end_of_file:
                     lines_before += line
                     continue
-                if not import_section:
+                if not import_section_lines:
                     output_stream.write("".join(lines_before))
                 else:
                     above_import_section = "".join(lines_before)
                 lines_before = []
 
+            import_section: str = "".join(import_section_lines)
             raw_import_section: str = import_section
             if (
                 add_imports
@@ -506,16 +519,21 @@ def process(
                     contains_imports = True
                 else:
                     contains_imports = False
-                import_section = next_import_section
+                import_section_lines = [next_import_section] if next_import_section else []
                 next_import_section = ""
             else:
                 output_stream.write(line)
                 not_imports = False
 
-            if stripped_line and not in_quote and not import_section and not next_import_section:
+            if (
+                stripped_line
+                and not in_quote
+                and not import_section_lines
+                and not next_import_section
+            ):
                 if stripped_line == "yield":
                     while not stripped_line or stripped_line == "yield":
-                        new_line = input_stream.readline()
+                        new_line = readline()
                         if not new_line:
                             break
 
@@ -524,7 +542,7 @@ def process(
 
                 if stripped_line.startswith(("raise", "yield")):
                     while stripped_line.endswith("\\"):
-                        new_line = input_stream.readline()
+                        new_line = readline()
                         if not new_line:
                             break
 
@@ -538,6 +556,24 @@ def process(
     return made_changes
 
 
+def _lines(pieces: deque[str]) -> Iterator[str]:
+    # Splits the same way iterating over a StringIO of the joined pieces would, releasing each
+    # piece as soon as it has been consumed.
+    partial_line = ""
+    while pieces:
+        *lines, partial_line = (partial_line + pieces.popleft()).split("\n")
+        for line in lines:
+            yield line + "\n"
+    if partial_line:
+        yield partial_line
+
+
+@lru_cache(maxsize=100)
+def _formatted_add_imports(config: Config) -> tuple[str, ...]:
+    return tuple(format_natural(addition) for addition in config.add_imports)
+
+
+@lru_cache(maxsize=100)
 def _indented_config(config: Config, indent: str) -> Config:
     if not indent:
         return config
@@ -0,0 +1,165 @@
+"""Defines isortd, a long running isort server that keeps configuration and caches warm.
+
+Editors and build tools that would otherwise start a fresh isort process for every invocation can
+instead send code to isortd over a local HTTP port or a Unix socket:
+
+    POST /sort   Responds with the sorted code (200), or no content when already sorted (204).
+    POST /check  Responds with no content when the code is correctly sorted (204), otherwise
+                 with a conflict (409).
+
+The request body is the code to process. The optional `X-File-Path` header names the file the code
+belongs to, which is used both to find its configuration and to honor skip settings, while the
+optional `X-Config` header holds a JSON object of configuration overrides.
+"""
+
+import argparse
+import json
+import os
+import socketserver
+import sys
+import time
+from collections.abc import Sequence
+from functools import lru_cache
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from io import StringIO
+from pathlib import Path
+from typing import Any
+
+from mypy_extensions import mypyc_attr
+
+from . import api, place
+from ._version import get_version
+from .exceptions import FileSkipped, ISortError
+from .settings import Config
+
+DEFAULT_HOST = "localhost"
+DEFAULT_PORT = 45485
+FILE_PATH_HEADER = "X-File-Path"
+CONFIG_HEADER = "X-Config"
+# Where modules are placed depends on the files on disk, which may change while isortd runs, so
+# placements older than this are forgotten.
+PLACEMENT_CACHE_SECONDS = 10.0
+
+_placements_cleared_at = time.monotonic()
+
+
+@lru_cache(maxsize=100)
+def _config(settings_path: str, overrides: str) -> Config:
+    return Config(settings_path=settings_path, **json.loads(overrides))
+
+
+def _expire_placements() -> None:
+    global _placements_cleared_at  # noqa: PLW0603
+
+    now = time.monotonic()
+    if now - _placements_cleared_at >= PLACEMENT_CACHE_SECONDS:
+        _placements_cleared_at = now
+        place.clear_caches()
+
+
+@mypyc_attr(native_class=False)
+class RequestHandler(BaseHTTPRequestHandler):
+    server_version = f"isortd/{get_version()}"
+
+    def do_POST(self) -> None:  # noqa: N802
+        if self.path not in ("/sort", "/check"):
+            self._respond(HTTPStatus.NOT_FOUND, "Unknown request, use either /sort or /check.")
+            return
+
+        try:
+            content_length = int(self.headers.get("Content-Length", 0))
+            if content_length < 0:
+                raise ValueError("Content-Length must not be negative.")
+            code = self.rfile.read(content_length).decode(self.headers.get_content_charset("utf-8"))
+            file_path_header = self.headers.get(FILE_PATH_HEADER)
+            file_path = Path(file_path_header) if file_path_header else None
+            config = _config(
+                os.path.dirname(os.path.abspath(file_path)) if file_path else os.getcwd(),
+                json.dumps(json.loads(self.headers.get(CONFIG_HEADER, "{}")), sort_keys=True),
+            )
+        except (ValueError, TypeError, LookupError, ISortError) as error:
+            self._respond(HTTPStatus.BAD_REQUEST, str(error))
+            return
+
+        _expire_placements()
+        output_stream = StringIO()
+        try:
+            changed = api.sort_stream(
+                StringIO(code), output_stream, config=config, file_path=file_path
+            )
+        except FileSkipped:
+            changed = False
+        except ISortError as error:
+            self._respond(HTTPStatus.BAD_REQUEST, str(error))
+            return
+        except Exception as error:
+            self._respond(HTTPStatus.INTERNAL_SERVER_ERROR, str(error))
+            return
+
+        if not changed:
+            self._respond(HTTPStatus.NO_CONTENT)
+        elif self.path == "/check":
+            self._respond(HTTPStatus.CONFLICT)
+        else:
+            self._respond(HTTPStatus.OK, output_stream.getvalue())
+
+    def _respond(self, status: HTTPStatus, body: str = "") -> None:
+        encoded_body = body.encode("utf-8")
+        self.send_response(status)
+        if status != HTTPStatus.NO_CONTENT:
+            self.send_header("Content-Type", "text/plain; charset=utf-8")
+            self.send_header("Content-Length", str(len(encoded_body)))
+        self.end_headers()
+        self.wfile.write(encoded_body)
+
+
+@mypyc_attr(native_class=False)
+class UnixHTTPServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def get_request(self) -> tuple[Any, Any]:
+        # Unix sockets have no client address, which the request handler expects for logging.
+        request, _ = super().get_request()
+        return request, ("local", 0)
+
+
+def make_server(
+    host: str = DEFAULT_HOST, port: int = DEFAULT_PORT, socket_path: str = ""
+) -> socketserver.BaseServer:
+    """Creates an isortd server bound to the given Unix socket path, or host and port otherwise."""
+    if socket_path:
+        return UnixHTTPServer(socket_path, RequestHandler)
+    return ThreadingHTTPServer((host, port), RequestHandler)
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Runs isort as a server, sorting the imports of code posted to it while "
+        "keeping configuration and caches warm between requests."
+    )
+    parser.add_argument("--bind-host", default=DEFAULT_HOST, help="Address to bind the server to.")
+    parser.add_argument("--bind-port", type=int, default=DEFAULT_PORT, help="Port to listen on.")
+    parser.add_argument(
+        "--socket",
+        dest="socket_path",
+        default="",
+        help="Listen on the given Unix socket path instead of a TCP port.",
+    )
+    arguments = parser.parse_args(argv)
+
+    server = make_server(arguments.bind_host, arguments.bind_port, arguments.socket_path)
+    listening_on = arguments.socket_path or f"{arguments.bind_host}:{arguments.bind_port}"
+    print(f"isortd version {get_version()} listening on {listening_on}", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if arguments.socket_path:
+            os.unlink(arguments.socket_path)
+
+
+if __name__ == "__main__":
+    main()
@@ -196,3 +196,12 @@ class MissingSection(ISortError):
             "See https://isort.readthedocs.io/en/latest/index.html#custom-sections-and-ordering "
             "for more info."
         )
+
+
+class ChangedFilesUnavailable(ISortError):
+    """Raised when the files changed since a git reference can't be determined"""
+
+    def __init__(self, ref: str, reason: str):
+        super().__init__(f"Unable to determine the files changed since {ref}: {reason}")
+        self.ref = ref
+        self.reason = reason
@@ -1,41 +1,371 @@
 import os
-from collections.abc import Iterable, Iterator
+from collections.abc import Iterable, Iterator, Sequence
+from functools import partial
 from pathlib import Path
+from typing import TYPE_CHECKING
 
+from isort.exceptions import ChangedFilesUnavailable
 from isort.settings import Config
 
+if TYPE_CHECKING:
+    import subprocess  # nosec
+
+# Paths are sent to `git check-ignore` in batches bounded by these limits, keeping both the paths
+# written and the results read back well within what a pipe can buffer.
+_GIT_CHECK_IGNORE_BATCH_SIZE = 64
+_GIT_CHECK_IGNORE_BATCH_BYTES = 8192
+
+
+class GitIgnoreFilter:
+    """Determines which files are ignored by git, in bulk.
+
+    Repository roots are found by looking for `.git` entries in parent directories, remembering
+    the answer for every directory visited along the way. Paths are then streamed through a single
+    long running `git check-ignore` process per repository, so submodules and nested repositories
+    cost one process each rather than several per folder.
+    """
+
+    def __init__(self) -> None:
+        self._roots: dict[str, str | None] = {}
+        self._real_roots: dict[str, str] = {}
+        self._processes: dict[str, subprocess.Popen[bytes] | None] = {}
+        self._buffers: dict[str, bytes] = {}
+
+    def close(self) -> None:
+        for process in self._processes.values():
+            if process is not None:
+                if process.stdin:
+                    process.stdin.close()
+                process.wait()
+        self._processes.clear()
+        self._buffers.clear()
+
+    def ignored(self, file_paths: Sequence[str]) -> list[bool]:
+        """Returns whether each of the given file paths is ignored by git."""
+        results = [False] * len(file_paths)
+        paths_by_root: dict[str, list[tuple[int, str]]] = {}
+        for index, file_path in enumerate(file_paths):
+            absolute_path = os.path.abspath(file_path)
+            root = self._root(os.path.dirname(absolute_path))
+            if root is None:
+                continue
+
+            real_root = self._real_roots.setdefault(root, os.path.realpath(root))
+            try:
+                relative_path = os.path.relpath(os.path.realpath(absolute_path), real_root)
+            except ValueError:  # pragma: no cover - on a different drive than the repository
+                relative_path = os.pardir
+            if relative_path == os.pardir or relative_path.startswith(os.pardir + os.sep):
+                # Links to files outside of the repository can't be tracked by it.
+                results[index] = True
+            else:
+                paths_by_root.setdefault(root, []).append(
+                    (index, relative_path.replace(os.sep, "/"))
+                )
+
+        for root, indexed_paths in paths_by_root.items():
+            for batch in _batches(indexed_paths):
+                for (index, _), is_ignored in zip(
+                    batch, self._check_ignore(root, [path for _, path in batch]), strict=True
+                ):
+                    results[index] = is_ignored
+        return results
+
+    def _root(self, directory: str) -> str | None:
+        visited: list[str] = []
+        root: str | None = None
+        while directory not in self._roots:
+            visited.append(directory)
+            if os.path.lexists(os.path.join(directory, ".git")):
+                root = directory
+                break
+
+            parent = os.path.dirname(directory)
+            if parent == directory:
+                break
+            directory = parent
+        else:
+            root = self._roots[directory]
+
+        for visited_directory in visited:
+            self._roots[visited_directory] = root
+        return root
+
+    def _check_ignore(self, root: str, relative_paths: list[str]) -> list[bool]:
+        import subprocess  # nosec # noqa: PLC0415 # Needed for gitignore support.
+
+        if root not in self._processes:
+            try:
+                self._processes[root] = subprocess.Popen(  # nosec
+                    ["git", "-C", root, "check-ignore", "--stdin", "-z", "--non-matching", "-v"],
+                    stdin=subprocess.PIPE,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.DEVNULL,
+                    env={**os.environ, "LANG": "C.UTF-8", "GIT_FLUSH": "1"},
+                )
+            except OSError:
+                self._processes[root] = None
+            self._buffers[root] = b""
+
+        process = self._processes[root]
+        if process is None or process.stdin is None or process.stdout is None:
+            return [False] * len(relative_paths)
+
+        try:
+            process.stdin.write(b"".join(os.fsencode(path) + b"\0" for path in relative_paths))
+            process.stdin.flush()
+        except OSError:  # git exited, for instance because the path isn't in a work tree
+            self._processes[root] = None
+            return [False] * len(relative_paths)
+
+        # Each path results in the source, line number and pattern of the last matching exclude
+        # rule, all empty when there isn't one, followed by the path itself.
+        fields_needed = 4 * len(relative_paths)
+        buffer = self._buffers[root]
+        while buffer.count(b"\0") < fields_needed:
+            chunk = os.read(process.stdout.fileno(), 65536)
+            if not chunk:
+                self._processes[root] = None
+                return [False] * len(relative_paths)
+            buffer += chunk
+
+        fields = buffer.split(b"\0", fields_needed)
+        self._buffers[root] = fields.pop()
+        # Matching a negated pattern, such as `!keep.py`, means the path is explicitly included.
+        return [
+            bool(fields[index]) and not fields[index + 2].startswith(b"!")
+            for index in range(0, fields_needed, 4)
+        ]
+
+
+def _batches(indexed_paths: list[tuple[int, str]]) -> Iterator[list[tuple[int, str]]]:
+    batch: list[tuple[int, str]] = []
+    batch_bytes = 0
+    for indexed_path in indexed_paths:
+        batch.append(indexed_path)
+        batch_bytes += len(indexed_path[1]) + 1
+        if (
+            len(batch) >= _GIT_CHECK_IGNORE_BATCH_SIZE
+            or batch_bytes >= _GIT_CHECK_IGNORE_BATCH_BYTES
+        ):
+            yield batch
+            batch = []
+            batch_bytes = 0
+    if batch:
+        yield batch
+
 
 def find(
-    paths: Iterable[str | Path], config: Config, skipped: list[str], broken: list[str]
+    paths: Iterable[str | Path],
+    config: Config,
+    skipped: list[str],
+    broken: list[str],
+    jobs: int = 1,
 ) -> Iterator[str | Path]:
-    """Finds and provides an iterator for all Python source files defined in paths."""
+    """Finds and provides an iterator for all Python source files defined in paths.
+
+    With `jobs` above one, the directories directly within each directory passed in are walked in
+    that many parallel threads.
+    """
     visited_dirs: set[Path] = set()
 
     for path in paths:
         if os.path.isdir(path):
-            for dirpath, dirnames, filenames in os.walk(
-                path, topdown=True, followlinks=config.follow_links
-            ):
-                base_path = Path(dirpath)
-                for dirname in list(dirnames):
-                    full_path = base_path / dirname
-                    resolved_path = full_path.resolve()
-                    if config.is_skipped(full_path):
-                        skipped.append(str(full_path))
-                        dirnames.remove(dirname)
-                    else:
-                        if resolved_path in visited_dirs:  # pragma: no cover
-                            dirnames.remove(dirname)
-                    visited_dirs.add(resolved_path)
-
-                for filename in filenames:
-                    filepath = os.path.join(dirpath, filename)
-                    if config.is_supported_filetype(filepath):
-                        if config.is_skipped(Path(os.path.abspath(filepath))):
-                            skipped.append(os.path.abspath(filepath))
-                        else:
-                            yield filepath
+            yield from _find_in_directory(os.fspath(path), config, skipped, visited_dirs, jobs)
         elif not os.path.exists(path):
             broken.append(str(path))
         else:
             yield path
+
+
+def changed_since(
+    ref: str, paths: Iterable[str | Path], config: Config, skipped: list[str]
+) -> Iterator[str]:
+    """Finds the Python source files within paths that changed since the given git reference,
+    including uncommitted changes, using a single `git diff` rather than walking directories.
+
+    Deleted files are left out, as are untracked files unless added with `git add -N`. Files
+    matching the skip settings are added to skipped rather than provided.
+    """
+    import subprocess  # nosec # noqa: PLC0415 # Needed for --changed-since support.
+
+    # The reference comes from the command line, so it mustn't be taken for one of git's options.
+    if ref.startswith("-"):
+        raise ChangedFilesUnavailable(ref, "not a git reference")
+
+    absolute_paths = [os.path.abspath(path) for path in paths]
+    directory = os.path.commonpath(
+        [path if os.path.isdir(path) else os.path.dirname(path) for path in absolute_paths]
+    )
+    try:
+        result = subprocess.run(  # nosec
+            [
+                "git",
+                "-C",
+                directory,
+                "diff",
+                "--name-only",
+                "-z",
+                "--relative",
+                "--diff-filter=d",
+                ref,
+                "--",
+                *absolute_paths,
+            ],
+            capture_output=True,
+            check=False,
+            env={**os.environ, "LANG": "C.UTF-8"},
+        )
+    except OSError as error:
+        raise ChangedFilesUnavailable(ref, str(error)) from error
+    if result.returncode:
+        raise ChangedFilesUnavailable(ref, result.stderr.decode(errors="replace").strip())
+
+    for relative_path in os.fsdecode(result.stdout).split("\0"):
+        if not relative_path:
+            continue
+
+        file_path = os.path.join(directory, relative_path)
+        if not config.is_supported_filetype(file_path):
+            continue
+        if config.is_skipped(Path(file_path), check_gitignore=False):
+            skipped.append(file_path)
+        else:
+            yield file_path
+
+
+def _find_in_directory(
+    directory: str, config: Config, skipped: list[str], visited_dirs: set[Path], jobs: int
+) -> Iterator[str]:
+    resolved_directory = Path(directory).resolve()
+    gitignore_filter = GitIgnoreFilter() if config.skip_gitignore else None
+    try:
+        if jobs <= 1:
+            yield from _walk(
+                directory, resolved_directory, config, skipped, visited_dirs, gitignore_filter
+            )
+            return
+
+        file_paths, subdirectories = _scan(
+            directory, resolved_directory, config, skipped, visited_dirs, gitignore_filter
+        )
+    finally:
+        if gitignore_filter:
+            gitignore_filter.close()
+
+    yield from file_paths
+    from concurrent.futures import ThreadPoolExecutor  # noqa: PLC0415
+
+    with ThreadPoolExecutor(jobs) as executor:
+        for subtree_file_paths, subtree_skipped in executor.map(
+            partial(_walk_subtree, config=config, visited_dirs=visited_dirs), subdirectories
+        ):
+            skipped.extend(subtree_skipped)
+            yield from subtree_file_paths
+
+
+def _walk_subtree(
+    subdirectory: tuple[str, Path], config: Config, visited_dirs: set[Path]
+) -> tuple[list[str], list[str]]:
+    skipped: list[str] = []
+    gitignore_filter = GitIgnoreFilter() if config.skip_gitignore else None
+    try:
+        file_paths = list(_walk(*subdirectory, config, skipped, visited_dirs, gitignore_filter))
+    finally:
+        if gitignore_filter:
+            gitignore_filter.close()
+    return file_paths, skipped
+
+
+def _walk(
+    directory: str,
+    resolved_directory: Path,
+    config: Config,
+    skipped: list[str],
+    visited_dirs: set[Path],
+    gitignore_filter: GitIgnoreFilter | None,
+) -> Iterator[str]:
+    # Walks top down in the same order as `os.walk`, without recursing.
+    pending = [(directory, resolved_directory)]
+    while pending:
+        file_paths, subdirectories = _scan(
+            *pending.pop(), config, skipped, visited_dirs, gitignore_filter
+        )
+        yield from file_paths
+        pending.extend(reversed(subdirectories))
+
+
+def _scan(
+    directory: str,
+    resolved_directory: Path,
+    config: Config,
+    skipped: list[str],
+    visited_dirs: set[Path],
+    gitignore_filter: GitIgnoreFilter | None,
+) -> tuple[list[str], list[tuple[str, Path]]]:
+    """Returns the source files directly within the given directory that aren't skipped, along
+    with the subdirectories to descend into.
+    """
+    try:
+        with os.scandir(directory) as scanned_entries:
+            entries = list(scanned_entries)
+    except OSError:
+        return [], []
+
+    directory_entries: list[os.DirEntry[str]] = []
+    file_entries: list[os.DirEntry[str]] = []
+    for entry in entries:
+        try:
+            is_dir = entry.is_dir()
+        except OSError:
+            is_dir = False
+        (directory_entries if is_dir else file_entries).append(entry)
+
+    subdirectories: list[tuple[str, Path]] = []
+    base_path = Path(directory)
+    for entry in directory_entries:
+        # The resolved path of an entry is only looked up on disk when it is a link.
+        is_symlink = entry.is_symlink()
+        resolved_path = (
+            Path(entry.path).resolve() if is_symlink else resolved_directory / entry.name
+        )
+        full_path = base_path / entry.name
+        if config.is_skipped(full_path, check_gitignore=False, resolved_path=resolved_path) or (
+            gitignore_filter and entry.name == ".git"
+        ):
+            skipped.append(str(full_path))
+        elif resolved_path not in visited_dirs and (config.follow_links or not is_symlink):
+            subdirectories.append((entry.path, resolved_path))
+        visited_dirs.add(resolved_path)
+
+    candidates: list[str] = []
+    for entry in file_entries:
+        if not config.is_supported_filetype(entry.path):
+            continue
+
+        absolute_path = os.path.abspath(entry.path)
+        is_symlink = entry.is_symlink()
+        if is_symlink or not entry.is_file():
+            # Links, and anything that is neither a regular file nor a link, are checked fully.
+            is_skipped = config.is_skipped(Path(absolute_path), check_gitignore=False)
+        else:
+            is_skipped = config.is_skipped(
+                Path(absolute_path),
+                check_gitignore=False,
+                resolved_path=resolved_directory / entry.name,
+            )
+        if is_skipped:
+            skipped.append(absolute_path)
+        else:
+            candidates.append(entry.path)
+
+    ignored = (
+        gitignore_filter.ignored(candidates) if gitignore_filter else [False] * len(candidates)
+    )
+    file_paths: list[str] = []
+    for file_path, is_ignored in zip(candidates, ignored, strict=True):
+        if is_ignored:
+            skipped.append(os.path.abspath(file_path))
+        else:
+            file_paths.append(file_path)
+    return file_paths, subdirectories
@@ -1,7 +1,5 @@
 import re
 import sys
-from datetime import datetime
-from difflib import unified_diff
 from pathlib import Path
 from typing import TextIO
 
@@ -56,6 +54,9 @@ def show_unified_diff(
     - **output**: A stream to output the diff to. If non is provided uses sys.stdout.
     - **color_output**: Use color in output if True.
     """
+    from datetime import datetime  # noqa: PLC0415
+    from difflib import unified_diff  # noqa: PLC0415
+
     printer = create_terminal_printer(color_output, output)
     file_name = "" if file_path is None else str(file_path)
     file_mtime = str(
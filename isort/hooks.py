@@ -10,6 +10,12 @@ from pathlib import Path
 
 from isort import Config, api, exceptions
 
+# Staged files are only checked in parallel when at least this many were modified, as starting the
+# worker processes takes longer than checking a few files.
+_PARALLEL_CHECK_MIN_FILES = 16
+
+_worker_options: dict[str, Config] = {}
+
 
 def get_output(command: list[str]) -> str:
     """Run a command and return raw output
@@ -31,12 +37,44 @@ def get_lines(command: list[str]) -> list[str]:
     return [line.strip() for line in stdout.splitlines()]
 
 
+def get_staged_contents(file_names: list[str]) -> list[str | None]:
+    """Read the staged contents of files through a single `git cat-file --batch` process
+
+    :param list[str] file_names: the files to read, relative to the root of the repository
+    :returns: the staged contents of each file, or None when it isn't staged
+    """
+    result = subprocess.run(  # nosec
+        ["git", "cat-file", "--batch"],
+        input="".join(f":{file_name}\n" for file_name in file_names).encode(),
+        stdout=subprocess.PIPE,
+        check=True,
+    )
+    output = result.stdout
+    contents: list[str | None] = []
+    position = 0
+    for _ in file_names:
+        # Each object found is a "<sha> <type> <size>" header followed by its contents and a
+        # newline, while missing ones are just "<name> missing", where the name may hold spaces.
+        header_end = output.index(b"\n", position)
+        header = output[position:header_end]
+        position = header_end + 1
+        if header.endswith(b" missing"):
+            contents.append(None)
+            continue
+
+        size = int(header.rsplit(b" ", 1)[1])
+        contents.append(output[position : position + size].decode())
+        position += size + 1
+    return contents
+
+
 def git_hook(
     strict: bool = False,
     modify: bool = False,
     lazy: bool = False,
     settings_file: str = "",
     directories: list[str] | None = None,
+    jobs: int | None = 1,
 ) -> int:
     """Git pre-commit hook to check staged files for isort errors
 
@@ -55,6 +93,11 @@ def git_hook(
         will be searched starting at the directory containing the first
         staged file, if any, and going upward in the directory structure.
     :param list[str] directories - A list of directories to restrict the hook to.
+    :param int jobs - The number of processes used to check files in parallel,
+        or None for one per CPU. Defaults to 1, checking every file in this
+        process, as do runs with only a few files. Scripts calling the hook
+        with more than one job must do so from within an
+        ``if __name__ == "__main__":`` block, as worker processes may import them.
 
     :return number of errors if in strict mode, 0 otherwise.
     """
@@ -70,30 +113,64 @@ def git_hook(
     if not files_modified:
         return 0
 
-    errors = 0
     config = Config(
         settings_file=settings_file,
         settings_path=os.path.dirname(os.path.abspath(files_modified[0])),
     )
-    for filename in files_modified:
-        if filename.endswith(".py"):
-            try:
-                check_passed = False
-                if lazy:
-                    # Check the file as-is on disk
-                    check_passed = api.check_file(filename, config=config)
-                else:
-                    # Read and check the git *staged* contents of the file
-                    staged_cmd = ["git", "show", f":{filename}"]
-                    staged_contents = get_output(staged_cmd)
-                    check_passed = api.check_code_string(
-                        staged_contents, file_path=Path(filename), config=config
-                    )
-                if not check_passed:
-                    errors += 1
-                    if modify:
-                        api.sort_file(filename, config=config)
-            except exceptions.FileSkipped:  # pragma: no cover
-                pass
+    python_files = [filename for filename in files_modified if filename.endswith(".py")]
+    if not python_files:
+        return 0
+
+    if lazy:
+        # Check the files as-is on disk
+        files_to_check: list[tuple[str, str | None]] = [
+            (filename, None) for filename in python_files
+        ]
+    else:
+        # Read and check the git *staged* contents of the files
+        files_to_check = [
+            (filename, staged_contents)
+            for filename, staged_contents in zip(
+                python_files, get_staged_contents(python_files), strict=True
+            )
+            if staged_contents is not None
+        ]
+
+    if jobs != 1 and len(files_to_check) >= _PARALLEL_CHECK_MIN_FILES:
+        import multiprocessing.pool  # noqa: PLC0415
+
+        with multiprocessing.pool.Pool(
+            jobs, initializer=_init_worker, initargs=(config,)
+        ) as executor:
+            results = executor.map(_check_in_worker, files_to_check)
+    else:
+        results = [_check(filename, contents, config) for filename, contents in files_to_check]
+
+    errors = 0
+    for (filename, _), check_passed in zip(files_to_check, results, strict=True):
+        if not check_passed:
+            errors += 1
+            if modify:
+                try:
+                    api.sort_file(filename, config=config)
+                except exceptions.FileSkipped:  # pragma: no cover
+                    pass
 
     return errors if strict else 0
+
+
+def _check(filename: str, contents: str | None, config: Config) -> bool:
+    try:
+        if contents is None:
+            return api.check_file(filename, config=config)
+        return api.check_code_string(contents, file_path=Path(filename), config=config)
+    except exceptions.FileSkipped:  # pragma: no cover
+        return True
+
+
+def _init_worker(config: Config) -> None:
+    _worker_options["config"] = config
+
+
+def _check_in_worker(file_to_check: tuple[str, str | None]) -> bool:
+    return _check(*file_to_check, config=_worker_options["config"])
@@ -8,6 +8,7 @@ from io import BytesIO, StringIO, TextIOWrapper
 from pathlib import Path
 from typing import TextIO
 
+from isort import profiling
 from isort.exceptions import UnsupportedEncoding
 
 
@@ -55,7 +56,9 @@ class File:
         file_path = Path(filename).resolve()
         stream = None
         try:
+            started = profiling.start()
             stream = File._open(file_path)
+            profiling.stop("read", started)
             yield File(stream=stream, path=file_path, encoding=stream.encoding)
         finally:
             if stream is not None:
@@ -1,4 +1,4 @@
-from ._version import _VERSION_STRING
+from ._version import get_version_string
 
 ASCII_ART = rf"""
                  _                 _
@@ -9,7 +9,7 @@ ASCII_ART = rf"""
 
       isort your imports, so you don't have to.
 
-                    VERSION {_VERSION_STRING}
+                    VERSION {get_version_string()}
 """
 
 __doc__ = f"""
@@ -3,22 +3,23 @@
 from __future__ import annotations
 
 import argparse
-import functools
 import json
 import os
 import sys
-from collections.abc import Iterator, Sequence
+import time
+from collections.abc import Iterable, Iterator, Sequence
 from contextlib import AbstractContextManager, nullcontext
 from dataclasses import asdict
 from gettext import gettext as _
 from io import TextIOWrapper
 from pathlib import Path
-from typing import Any
+from typing import Any, NamedTuple
 from warnings import warn
 
-from . import api, files, sections
-from ._version import _VERSION_STRING
-from .exceptions import FileSkipped, ISortError, UnsupportedEncoding
+from mypy_extensions import mypyc_attr
+
+from . import _version, api, cache, files, profiling, sections
+from .exceptions import ChangedFilesUnavailable, FileSkipped, ISortError, UnsupportedEncoding
 from .format import create_terminal_printer
 from .logo import ASCII_ART
 from .profiles import profiles
@@ -42,6 +43,14 @@ Visit https://isort.readthedocs.io/ for complete information about how to use is
 """
 
 
+# Files are dispatched to `--jobs` workers in chunks of about this many bytes, so that many small
+# files don't each pay for a round trip to a worker, while a file larger than this is sent alone.
+JOBS_CHUNK_BYTES = 256 * 1024
+JOBS_CHUNK_MAX_FILES = 256
+# Files that need more memory than this to sort are flagged by `--profile-memory`.
+PROFILE_MEMORY_THRESHOLD_MB = 50.0
+
+
 class SortAttempt:
     def __init__(self, incorrectly_sorted: bool, skipped: bool, supported_encoding: bool) -> None:
         self.incorrectly_sorted = incorrectly_sorted
@@ -98,6 +107,158 @@ def sort_imports(
         raise
 
 
+# The arguments to `sort_imports` shared by every file, set once per worker process.
+_worker_sort_options: dict[str, Any] = {}
+
+
+def _init_worker(
+    sort_options: dict[str, Any], profile_stages: bool = False, profile_memory: bool = False
+) -> None:
+    _worker_sort_options.update(sort_options)
+    if profile_stages:
+        profiling.enable()
+        # Forked workers start out with whatever the parent process had recorded so far.
+        profiling.collect()
+    if profile_memory:
+        profiling.start_tracing_memory()
+
+
+def _sort_chunk(file_names: list[str | Path]) -> list[tuple[bool, bool, bool] | None]:
+    results: list[tuple[bool, bool, bool] | None] = []
+    for file_name in file_names:
+        attempt = sort_imports(file_name, **_worker_sort_options)
+        results.append(
+            (attempt.incorrectly_sorted, attempt.skipped, attempt.supported_encoding)
+            if attempt
+            else None
+        )
+    return results
+
+
+class FileDetails(NamedTuple):
+    file_name: str
+    seconds: float
+    size: int
+    # The peak memory allocated while sorting the file, when memory is being traced.
+    peak_memory: int | None
+
+
+class ChunkDetails(NamedTuple):
+    files: list[FileDetails]
+    stage_totals: dict[str, tuple[float, int]]
+    process_id: int
+    peak_rss: int | None
+
+
+def _sort_with_details(
+    file_names: Iterable[str | Path], sort_options: dict[str, Any], details: list[FileDetails]
+) -> Iterator[SortAttempt | None]:
+    """Sorts the given files, recording the time each took along with its size in bytes and, if
+    memory is being traced, the peak memory allocated while sorting it.
+    """
+    for file_name in file_names:
+        try:
+            file_size = os.path.getsize(file_name)
+        except OSError:
+            file_size = 0
+        tracing_memory = profiling.reset_peak_memory()
+        start = time.perf_counter()
+        attempt = sort_imports(file_name, **sort_options)
+        seconds = time.perf_counter() - start
+        peak_memory = profiling.peak_memory() if tracing_memory else None
+        details.append(FileDetails(str(file_name), seconds, file_size, peak_memory))
+        yield attempt
+
+
+def _detailed_sort_chunk(
+    file_names: list[str | Path],
+) -> tuple[list[tuple[bool, bool, bool] | None], ChunkDetails]:
+    details: list[FileDetails] = []
+    results = [
+        (attempt.incorrectly_sorted, attempt.skipped, attempt.supported_encoding)
+        if attempt
+        else None
+        for attempt in _sort_with_details(file_names, _worker_sort_options, details)
+    ]
+    return results, ChunkDetails(details, profiling.collect(), os.getpid(), profiling.peak_rss())
+
+
+def _with_details(
+    chunk_results: Iterable[tuple[list[tuple[bool, bool, bool] | None], ChunkDetails]],
+    chunk_details: list[ChunkDetails],
+) -> Iterator[list[tuple[bool, bool, bool] | None]]:
+    for results, details in chunk_results:
+        chunk_details.append(details)
+        yield results
+
+
+def _write_summary(
+    path: str,
+    config: Config,
+    counts: dict[str, int],
+    details: list[FileDetails],
+    seconds: float,
+    slowest: int,
+) -> None:
+    """Writes a JSON summary of the run, including the slowest files along with their number of
+    imports, to the given path.
+    """
+    slowest_files = []
+    for file_details in sorted(details, key=lambda file_details: -file_details.seconds)[:slowest]:
+        try:
+            imports: int | None = sum(
+                1 for _ in api.find_imports_in_file(file_details.file_name, config)
+            )
+        except (OSError, UnicodeDecodeError):
+            imports = None
+        slowest_file: dict[str, Any] = {
+            "path": file_details.file_name,
+            "seconds": file_details.seconds,
+            "bytes": file_details.size,
+            "imports": imports,
+        }
+        if file_details.peak_memory is not None:
+            slowest_file["peak_memory"] = file_details.peak_memory
+        slowest_files.append(slowest_file)
+
+    summary = {
+        **counts,
+        "bytes_read": sum(file_details.size for file_details in details),
+        "seconds": seconds,
+        "slowest": slowest_files,
+    }
+    with open(path, "w", encoding="utf-8") as summary_file:
+        json.dump(summary, summary_file, indent=4)
+        summary_file.write("\n")
+
+
+def _chunk_by_size(
+    file_names: Iterable[str | Path],
+    chunk_bytes: int = JOBS_CHUNK_BYTES,
+    max_files: int = JOBS_CHUNK_MAX_FILES,
+) -> Iterator[list[str | Path]]:
+    chunk: list[str | Path] = []
+    chunk_size = 0
+    for file_name in file_names:
+        try:
+            file_size = os.path.getsize(file_name)
+        except OSError:
+            file_size = 0
+
+        if file_size >= chunk_bytes:
+            yield [file_name]
+            continue
+
+        chunk.append(file_name)
+        chunk_size += file_size
+        if chunk_size >= chunk_bytes or len(chunk) >= max_files:
+            yield chunk
+            chunk = []
+            chunk_size = 0
+    if chunk:
+        yield chunk
+
+
 def _print_hard_fail(
     config: Config, offending_file: str | Path | None = None, message: str | None = None
 ) -> None:
@@ -113,6 +274,17 @@ def _print_hard_fail(
     printer.error(message)
 
 
+@mypyc_attr(native_class=False)
+class _VersionAction(argparse.Action):
+    """Prints the version number and exits, like argparse's own version action, but only looks
+    the version up when the option is used.
+    """
+
+    def __call__(self, parser: argparse.ArgumentParser, *_: Any) -> None:
+        print(_version.get_version_string())
+        parser.exit()
+
+
 def _build_arg_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         description="Sort Python import definitions alphabetically "
@@ -149,8 +321,8 @@ def _build_arg_parser() -> argparse.ArgumentParser:
     general_group.add_argument(
         "--vn",
         "--version-number",
-        action="version",
-        version=_VERSION_STRING,
+        action=_VersionAction,
+        nargs=0,
         help="Returns just the current version number without the logo",
     )
     general_group.add_argument(
@@ -274,6 +446,62 @@ def _build_arg_parser() -> argparse.ArgumentParser:
         nargs="?",
         const=-1,
     )
+    general_group.add_argument(
+        "--profile-stages",
+        dest="profile_stages",
+        nargs="?",
+        const="text",
+        choices=("text", "json"),
+        help="Records the time spent in, and the number of calls made to, each stage of sorting: "
+        "finding files, resolving config, reading, parsing, placing modules, building and "
+        "wrapping the output, atomic compile checks and writing. The totals are printed to "
+        "stderr at the end of the run, as a table or as JSON.",
+    )
+    general_group.add_argument(
+        "--profile-memory",
+        dest="profile_memory",
+        nargs="?",
+        const=PROFILE_MEMORY_THRESHOLD_MB,
+        type=float,
+        metavar="THRESHOLD_MB",
+        help="Traces memory allocations, reporting the peak resident memory of every process "
+        "along with the files that needed the most memory to sort. Files that needed more than "
+        f"the given number of megabytes, {PROFILE_MEMORY_THRESHOLD_MB:g} by default, are "
+        "flagged. Tracing makes sorting considerably slower.",
+    )
+    general_group.add_argument(
+        "--summary-json",
+        dest="summary_json",
+        help="Writes a JSON summary of the run to the given path: the number of files processed, "
+        "changed and skipped, the bytes read, the total time taken and the slowest files along "
+        "with their number of imports.",
+    )
+    general_group.add_argument(
+        "--summary-slowest",
+        dest="summary_slowest",
+        type=int,
+        help="The number of slowest files listed by --summary-json, 10 by default.",
+    )
+    general_group.add_argument(
+        "--cache",
+        dest="use_cache",
+        action="store_true",
+        help="Tells isort to remember which files were already correctly sorted, keyed by their "
+        "content and the effective configuration, and skip them on subsequent runs.",
+    )
+    general_group.add_argument(
+        "--cache-dir",
+        dest="cache_dir",
+        help="Explicitly set the directory used by --cache. Defaults to a per-user cache "
+        "directory.",
+    )
+    general_group.add_argument(
+        "--cache-max-entries",
+        dest="cache_max_entries",
+        type=int,
+        help="The maximum number of entries kept by --cache, least recently used entries are "
+        "removed once exceeded. The cache is checked for this at most once an hour.",
+    )
     general_group.add_argument(
         "--ac",
         "--atomic",
@@ -308,6 +536,23 @@ def _build_arg_parser() -> argparse.ArgumentParser:
     target_group.add_argument(
         "files", nargs="*", help="One or more Python source files that need their imports sorted."
     )
+    target_group.add_argument(
+        "--changed-since",
+        dest="changed_since",
+        metavar="REF",
+        help="Only sort the files within the given paths that changed since the given git "
+        "reference, such as a branch, tag or commit, including uncommitted changes. The changed "
+        "files are listed by a single git diff instead of walking directories. Untracked files "
+        "are left out unless added with `git add -N`.",
+    )
+    target_group.add_argument(
+        "--watch",
+        dest="watch",
+        action="store_true",
+        help="Keeps running after sorting the given paths, sorting or checking files again as "
+        "soon as they change. Changes are reported by inotify on Linux and found by regularly "
+        "scanning the paths elsewhere. Bursts of changes are handled together.",
+    )
     target_group.add_argument(
         "--filter-files",
         dest="filter_files",
@@ -370,6 +615,21 @@ def _build_arg_parser() -> argparse.ArgumentParser:
         action="append",
         help="Specifies what extensions isort can never be run against.",
     )
+    target_group.add_argument(
+        "--never-sniff-extension",
+        dest="never_sniff_extensions",
+        action="append",
+        help="Specifies extensions of files that are never opened to look for a Python shebang, "
+        "which is otherwise done for files with unsupported extensions. Replaces the default "
+        "extensions, use --extend-never-sniff-extension to add to them.",
+    )
+    target_group.add_argument(
+        "--extend-never-sniff-extension",
+        dest="extend_never_sniff_extensions",
+        action="append",
+        help="Additional extensions of files that are never opened to look for a Python shebang "
+        "(extending --never-sniff-extension).",
+    )
     target_group.add_argument(
         "--dont-follow-links",
         dest="dont_follow_links",
@@ -999,6 +1259,7 @@ def identify_imports_main(
 # the main entrypoints so sort of expected to be complex.
 # skipcq: PY-R1000
 def main(argv: Sequence[str] | None = None, stdin: TextIOWrapper | None = None) -> None:
+    start_time = time.perf_counter()
     arguments = parse_args(argv)
     if arguments.get("show_version"):
         print(ASCII_ART)
@@ -1040,6 +1301,12 @@ def main(argv: Sequence[str] | None = None, stdin: TextIOWrapper | None = None)
     config_dict = arguments.copy()
     ask_to_apply = config_dict.pop("ask_to_apply", False)
     jobs = config_dict.pop("jobs", None)
+    profile_stages = config_dict.pop("profile_stages", None)
+    summary_json = config_dict.pop("summary_json", None)
+    summary_slowest = config_dict.pop("summary_slowest", 10)
+    profile_memory = config_dict.pop("profile_memory", None)
+    changed_since = config_dict.pop("changed_since", None)
+    watch_paths = config_dict.pop("watch", False)
     check = config_dict.pop("check", False)
     show_diff = config_dict.pop("show_diff", False)
     write_to_stdout = config_dict.pop("write_to_stdout", False)
@@ -1053,6 +1320,14 @@ def main(argv: Sequence[str] | None = None, stdin: TextIOWrapper | None = None)
     all_attempt_broken = False
     no_valid_encodings = False
 
+    if profile_stages:
+        profiling.enable()
+    if profile_memory:
+        profiling.start_tracing_memory()
+    # Details of the files sorted in this process and by each chunk sent to `--jobs` workers.
+    file_details: list[FileDetails] = []
+    chunk_details: list[ChunkDetails] = []
+
     config_trie: Trie | None = None
     if resolve_all_configs:
         config_trie = find_all_configs(config_dict.pop("config_root", "."))
@@ -1072,6 +1347,8 @@ def main(argv: Sequence[str] | None = None, stdin: TextIOWrapper | None = None)
             sys.exit("Error: can't show files for streaming input.")
         if config.sort_reexports:
             sys.exit("Error: --sort-reexports is not supported with streaming input (stdin).")
+        if watch_paths:
+            sys.exit("Error: --watch is not supported with streaming input (stdin).")
 
         input_stream = sys.stdin if stdin is None else stdin
         if check:
@@ -1123,55 +1400,79 @@ def main(argv: Sequence[str] | None = None, stdin: TextIOWrapper | None = None)
                     filtered_files.append(file_name)
             file_names = filtered_files
 
-        file_names = files.find(file_names, config, skipped, broken)
+        watched_paths = [os.fspath(file_name) for file_name in file_names]
+        if changed_since:
+            try:
+                file_names = list(files.changed_since(changed_since, file_names, config, skipped))
+            except ChangedFilesUnavailable as error:
+                printer = create_terminal_printer(
+                    color=config.color_output,
+                    error=config.format_error,
+                    success=config.format_success,
+                )
+                printer.error(str(error))
+                sys.exit(1)
+        else:
+            # With --jobs, directories are also walked in parallel while looking for files to sort.
+            walk_jobs = (jobs if jobs > 0 else os.cpu_count() or 1) if jobs else 1
+            file_names = files.find(file_names, config, skipped, broken, jobs=walk_jobs)
+            if profile_stages:
+                file_names = profiling.iterate("find", file_names)
         if show_files:
             for file_name in file_names:
                 print(file_name)
             return
+        num_processed = 0
+        num_changed = 0
         num_skipped = 0
         num_broken = 0
         num_invalid_encoding = 0
         if config.verbose:
             print(ASCII_ART)
 
+        sort_options: dict[str, Any] = {
+            "config": config,
+            "check": check,
+            "ask_to_apply": ask_to_apply,
+            "show_diff": show_diff,
+            "write_to_stdout": write_to_stdout,
+            "extension": ext_format,
+            "config_trie": config_trie,
+        }
         if jobs:
             import multiprocessing.pool  # noqa: PLC0415
 
+            # The options are sent to each worker once, rather than along with every file.
             executor_ctx: multiprocessing.pool.Pool | AbstractContextManager[None] = (
-                multiprocessing.pool.Pool(jobs if jobs > 0 else multiprocessing.cpu_count())
+                multiprocessing.pool.Pool(
+                    jobs if jobs > 0 else multiprocessing.cpu_count(),
+                    initializer=_init_worker,
+                    initargs=(sort_options, bool(profile_stages), bool(profile_memory)),
+                )
             )
         else:
             executor_ctx = nullcontext()
 
         with executor_ctx as executor:
             if executor is not None:
-                attempt_iterator: Iterator[SortAttempt | None] = executor.imap(
-                    functools.partial(
-                        sort_imports,
-                        config=config,
-                        check=check,
-                        ask_to_apply=ask_to_apply,
-                        show_diff=show_diff,
-                        write_to_stdout=write_to_stdout,
-                        extension=ext_format,
-                        config_trie=config_trie,
-                    ),
-                    file_names,
+                chunk_results: Iterable[list[tuple[bool, bool, bool] | None]] = (
+                    _with_details(
+                        executor.imap(_detailed_sort_chunk, _chunk_by_size(file_names)),
+                        chunk_details,
+                    )
+                    if profile_stages or summary_json or profile_memory
+                    else executor.imap(_sort_chunk, _chunk_by_size(file_names))
                 )
+                attempt_iterator: Iterator[SortAttempt | None] = (
+                    SortAttempt(*result) if result else None
+                    for results in chunk_results
+                    for result in results
+                )
+            elif summary_json or profile_memory:
+                attempt_iterator = _sort_with_details(file_names, sort_options, file_details)
             else:
-                # https://github.com/python/typeshed/pull/2814
                 attempt_iterator = (
-                    sort_imports(
-                        file_name,
-                        config=config,
-                        check=check,
-                        ask_to_apply=ask_to_apply,
-                        show_diff=show_diff,
-                        write_to_stdout=write_to_stdout,
-                        extension=ext_format,
-                        config_trie=config_trie,
-                    )
-                    for file_name in file_names
+                    sort_imports(file_name, **sort_options) for file_name in file_names
                 )
 
             # If any files passed in are missing considered as error, should be removed
@@ -1181,6 +1482,16 @@ def main(argv: Sequence[str] | None = None, stdin: TextIOWrapper | None = None)
                 if not sort_attempt:
                     continue  # pragma: no cover - shouldn't happen, satisfies type constraint
                 incorrectly_sorted = sort_attempt.incorrectly_sorted
+                num_processed += 1
+                if check:
+                    num_changed += incorrectly_sorted
+                else:
+                    # When sorting, the attempt holds whether sort_file left the file unchanged.
+                    num_changed += not (
+                        incorrectly_sorted
+                        or sort_attempt.skipped
+                        or not sort_attempt.supported_encoding
+                    )
                 if arguments.get("check", False) and incorrectly_sorted:
                     wrong_sorted_files = True
                 if sort_attempt.skipped:
@@ -1195,6 +1506,9 @@ def main(argv: Sequence[str] | None = None, stdin: TextIOWrapper | None = None)
 
                 is_no_attempt = False
 
+        if config.use_cache:
+            cache.prune_if_due(config)
+
         num_skipped += len(skipped)
         if num_skipped and not config.quiet:
             if config.verbose:
@@ -1215,11 +1529,73 @@ def main(argv: Sequence[str] | None = None, stdin: TextIOWrapper | None = None)
                     )
             print(f"Broken {num_broken} paths")
 
+        file_details.extend(chunk_file for details in chunk_details for chunk_file in details.files)
+        if profile_memory:
+            peak_rss = {details.process_id: details.peak_rss for details in chunk_details}
+            peak_rss[os.getpid()] = profiling.peak_rss()
+            print(
+                profiling.memory_report(
+                    [
+                        (details.file_name, details.peak_memory)
+                        for details in file_details
+                        if details.peak_memory is not None
+                    ],
+                    peak_rss,
+                    profile_memory * 1024 * 1024,
+                ),
+                file=sys.stderr,
+            )
+
+        if summary_json:
+            _write_summary(
+                summary_json,
+                config,
+                {
+                    "processed": num_processed,
+                    "changed": num_changed,
+                    "skipped": num_skipped,
+                    "broken": num_broken,
+                    "invalid_encoding": num_invalid_encoding,
+                },
+                file_details,
+                time.perf_counter() - start_time,
+                summary_slowest,
+            )
+
+        if watch_paths:
+            from . import watch  # noqa: PLC0415
+
+            if not config.quiet:
+                print("Watching for changes, press Ctrl+C to stop.")
+
+            def sort_changed(changed_files: list[str]) -> None:
+                for file_name in changed_files:
+                    sort_imports(file_name, **sort_options)
+
+            try:
+                watch.watch(watched_paths, config, sort_changed)
+            except KeyboardInterrupt:
+                pass
+
         if num_broken > 0 and is_no_attempt:
             all_attempt_broken = True
         if num_invalid_encoding > 0 and not any_encoding_valid:
             no_valid_encodings = True
 
+    if profile_memory:
+        profiling.stop_tracing_memory()
+    if profile_stages:
+        profiling.disable()
+        print(
+            profiling.report(
+                profiling.merge(
+                    profiling.collect(), *(details.stage_totals for details in chunk_details)
+                ),
+                profile_stages,
+            ),
+            file=sys.stderr,
+        )
+
     if wrong_sorted_files:
         sys.exit(1)
 
@@ -1,12 +1,12 @@
 import copy
 import itertools
 from collections.abc import Iterable
-from functools import partial
+from functools import lru_cache, partial
 from typing import Literal
 
 from isort.format import format_simplified
 
-from . import _parse_utils, parse, sorting, wrap, wrap_modes
+from . import _parse_utils, parse, profiling, sorting, wrap, wrap_modes
 from .comments import add_to_line as with_comments
 from .identify import STATEMENT_DECLARATIONS
 from .place import module_with_reason
@@ -26,11 +26,13 @@ def sorted_imports(
     (at the index of the first import) sorted alphabetically and split between groups
 
     """
+    started = profiling.start()
     if parsed.import_index == -1:
+        profiling.stop("output", started)
         return _output_as_string(parsed.lines_without_imports, parsed.line_separator)
 
     formatted_output: list[str] = parsed.lines_without_imports.copy()
-    remove_imports = [format_simplified(removal) for removal in config.remove_imports]
+    remove_imports = _simplified_remove_imports(config)
 
     sections: Iterable[str] = itertools.chain(parsed.sections, config.forced_separate)
 
@@ -202,6 +204,7 @@ def sorted_imports(
                     new_out_lines.append("")
         formatted_output = new_out_lines
 
+    profiling.stop("output", started)
     return _output_as_string(formatted_output, parsed.line_separator)
 
 
@@ -211,7 +214,7 @@ def _build_import_group(
     parsed: parse.ParsedContent,
     config: Config,
     section: str,
-    remove_imports: list[str],
+    remove_imports: frozenset[str],
     import_type: str,
     *,
     is_lazy: bool,
@@ -501,7 +504,7 @@ def _with_from_imports(
     config: Config,
     from_modules: Iterable[str],
     section: str,
-    remove_imports: list[str],
+    remove_imports: frozenset[str],
     import_type: str,
     *,
     is_lazy: bool,
@@ -534,7 +537,7 @@ def _with_from_imports_for_module(
     parsed: parse.ParsedContent,
     config: Config,
     section: str,
-    remove_imports: list[str],
+    remove_imports: frozenset[str],
     import_type: str,
     import_key: Literal["lazy_from", "from"],
 ) -> list[str]:
@@ -786,7 +789,7 @@ def _with_straight_imports(
     config: Config,
     straight_modules: Iterable[str],
     section: str,
-    remove_imports: list[str],
+    remove_imports: frozenset[str],
     import_type: str,
     *,
     is_lazy: bool,
@@ -862,6 +865,11 @@ def _with_straight_imports(
     return output
 
 
+@lru_cache(maxsize=100)
+def _simplified_remove_imports(config: Config) -> frozenset[str]:
+    return frozenset(format_simplified(removal) for removal in config.remove_imports)
+
+
 def _output_as_string(lines: list[str], line_separator: str) -> str:
     return line_separator.join(_normalize_empty_lines(lines))
 
@@ -905,7 +913,9 @@ def _separate_packages(section_output: list[str], config: Config) -> list[str]:
             continue
 
         package_name: str = section_line.split(" ")[1]
+        started = profiling.start()
         _, reason = module_with_reason(package_name, config)
+        profiling.stop("place", started)
 
         if "Matched configured known pattern" in reason:
             package_depth = len(reason.split(".")) - 1  # minus 1 for re.compile
@@ -6,7 +6,7 @@ from itertools import chain
 from typing import TYPE_CHECKING, NamedTuple, TypedDict
 from warnings import warn
 
-from . import place
+from . import place, profiling
 from ._parse_utils import (
     collect_import_continuation,
     import_type,
@@ -76,6 +76,7 @@ class ParsedContent(NamedTuple):
 # skipcq: PY-R1000
 def file_contents(contents: str, config: Config = DEFAULT_CONFIG) -> ParsedContent:
     """Parses a python file taking out and categorizing imports."""
+    started = profiling.start()
     line_separator: str = config.line_ending or _infer_line_separator(contents)
     # ``str.splitlines`` also treats characters such as form feed as line
     # boundaries, even though Python's universal-newline handling does not.
@@ -474,6 +475,7 @@ def file_contents(contents: str, config: Config = DEFAULT_CONFIG) -> ParsedConte
 
     change_count = len(out_lines) - original_line_count
 
+    profiling.stop("parse", started)
     return ParsedContent(
         in_lines=in_lines,
         lines_without_imports=out_lines,
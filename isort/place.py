@@ -1,12 +1,14 @@
 """Contains all logic related to placing an import within a certain section."""
 
+import hashlib
 import importlib
+import os
 from collections.abc import Iterable
 from fnmatch import fnmatch
 from functools import lru_cache
 from pathlib import Path
 
-from isort import sections
+from isort import profiling, sections
 from isort.settings import DEFAULT_CONFIG, Config
 from isort.utils import exists_case_sensitive
 
@@ -15,7 +17,10 @@ LOCAL = "LOCALFOLDER"
 
 def module(name: str, config: Config = DEFAULT_CONFIG) -> str:
     """Returns the section placement for the given module name."""
-    return module_with_reason(name, config)[0]
+    started = profiling.start()
+    placement = module_with_reason(name, config)[0]
+    profiling.stop("place", started)
+    return placement
 
 
 @lru_cache(maxsize=1000)
@@ -30,6 +35,32 @@ def module_with_reason(name: str, config: Config = DEFAULT_CONFIG) -> tuple[str,
     )
 
 
+def clear_caches() -> None:
+    """Forgets the placement of modules and what was found on disk while placing them, for long
+    running processes where source files may be added or removed.
+    """
+    module_with_reason.cache_clear()
+    src_paths_fingerprint.cache_clear()
+    _module_index.cache_clear()
+    _is_namespace_package.cache_clear()
+    exists_case_sensitive.cache_clear()
+
+
+@lru_cache(maxsize=100)
+def src_paths_fingerprint(config: Config) -> str:
+    """Returns a digest of the packages and modules found directly within each of the configured
+    src_paths, which decide whether modules are placed as first party.
+    """
+    fingerprint = hashlib.sha256()
+    for src_path in config.src_paths:
+        packages, modules = _module_index(src_path)
+        fingerprint.update(b"%d" % src_path.is_dir())
+        for names in (packages, modules):
+            fingerprint.update("\0".join(sorted(names)).encode("utf-8", "surrogateescape"))
+            fingerprint.update(b"\1")
+    return fingerprint.hexdigest()
+
+
 def _forced_separate(name: str, config: Config) -> tuple[str, str] | None:
     for forced_separate in config.forced_separate:
         # Ensure all forced_separate patterns will match to end of string
@@ -54,9 +85,10 @@ def _known_pattern(name: str, config: Config) -> tuple[str, str] | None:
     parts = name.split(".")
     module_names_to_check = (".".join(parts[:first_k]) for first_k in range(len(parts), 0, -1))
     for module_name_to_check in module_names_to_check:
-        for pattern, placement in config.known_patterns:
-            if placement in config.sections and pattern.match(module_name_to_check):
-                return (placement, f"Matched configured known pattern {pattern}")
+        match = config.known_pattern_matcher.match(module_name_to_check)
+        if match:
+            pattern, placement = match
+            return (placement, f"Matched configured known pattern {pattern}")
 
     return None
 
@@ -75,20 +107,24 @@ def _src_path(
     namespace = ".".join(new_prefix)
 
     for src_path in src_paths:
-        module_path = (src_path / root_module_name).resolve()
-        if not prefix and not module_path.is_dir() and src_path.name == root_module_name:
-            module_path = src_path.resolve()
+        module_path = src_path / root_module_name
+        packages, modules = _module_index(src_path)
+        if not prefix and root_module_name not in packages and src_path.name == root_module_name:
+            module_path = src_path
+            packages, modules = _module_index(src_path.parent)
+        is_package = root_module_name in packages
         if nested_module and (
             namespace in config.namespace_packages
             or (
                 config.auto_identify_namespace_packages
-                and _is_namespace_package(module_path, config.supported_extensions)
+                and is_package
+                and _is_namespace_package(module_path.resolve(), config.supported_extensions)
             )
         ):
-            return _src_path(nested_module[0], config, (module_path,), new_prefix)
+            return _src_path(nested_module[0], config, (module_path.resolve(),), new_prefix)
         if (
-            _is_module(module_path)
-            or _is_package(module_path)
+            is_package
+            or root_module_name in modules
             or _src_path_is_module(src_path, root_module_name)
         ):
             return (sections.FIRSTPARTY, f"Found in one of the configured src_paths: {src_path}.")
@@ -96,21 +132,34 @@ def _src_path(
     return None
 
 
-def _is_module(path: Path) -> bool:
-    return (
-        exists_case_sensitive(str(path.with_suffix(".py")))
-        or any(
-            exists_case_sensitive(str(path.with_suffix(ext_suffix)))
-            for ext_suffix in importlib.machinery.EXTENSION_SUFFIXES
-        )
-        or exists_case_sensitive(str(path / "__init__.py"))
-    )
+@lru_cache(maxsize=1000)
+def _module_index(directory: Path) -> tuple[frozenset[str], frozenset[str]]:
+    # Index every package and module importable from the directory using a single scan, so
+    # placing a module is a set lookup rather than a series of filesystem probes.
+    packages: set[str] = set()
+    modules: set[str] = set()
+    module_suffixes = (".py", *importlib.machinery.EXTENSION_SUFFIXES)
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_symlink() and not os.path.exists(entry.path):
+                    continue
+                if entry.is_dir():
+                    packages.add(entry.name)
+                for suffix in module_suffixes:
+                    if entry.name.endswith(suffix):
+                        modules.add(entry.name[: -len(suffix)])
+                        break
+    except OSError:
+        pass
+    return frozenset(packages), frozenset(modules)
 
 
 def _is_package(path: Path) -> bool:
     return exists_case_sensitive(str(path)) and path.is_dir()
 
 
+@lru_cache(maxsize=1000)
 def _is_namespace_package(path: Path, src_extensions: frozenset[str]) -> bool:
     if not _is_package(path):
         return False
@@ -0,0 +1,186 @@
+"""Opt-in instrumentation that records the wall time spent in, and the number of calls made to,
+each stage of isort's sort pipeline, as enabled by `--profile-stages`, along with the memory used
+to sort each file, as enabled by `--profile-memory`.
+
+Stages are measured by calls to `start` and `stop` at their boundaries, which only check whether
+profiling is enabled otherwise, so regular runs barely pay anything for it. Times include nested
+stages, for instance modules are placed while parsing.
+"""
+
+import json
+import sys
+import time
+import tracemalloc
+from collections.abc import Iterable, Iterator
+from typing import TypeVar
+
+_T = TypeVar("_T")
+
+# The stages of the pipeline, in the order they are reported in.
+STAGES: tuple[str, ...] = (
+    "find",
+    "config",
+    "read",
+    "parse",
+    "place",
+    "output",
+    "wrap",
+    "compile",
+    "write",
+)
+
+_enabled = False
+_totals: dict[str, list[float]] = {}
+# The memory traced before sorting the current file, which its peak memory is relative to.
+_memory_baseline = 0
+
+
+def enable() -> None:
+    """Starts timing the stages of the pipeline."""
+    global _enabled  # noqa: PLW0603
+    _enabled = True
+
+
+def disable() -> None:
+    """Stops timing the stages of the pipeline."""
+    global _enabled  # noqa: PLW0603
+    _enabled = False
+
+
+def start() -> float:
+    """Returns the time a stage starts at, to be passed on to `stop` once it's done, or 0 when
+    profiling isn't enabled.
+    """
+    return time.perf_counter() if _enabled else 0.0
+
+
+def stop(stage: str, started: float, calls: int = 1) -> None:
+    """Records the time spent in the given stage since it started, as returned by `start`."""
+    if started:
+        _record(stage, time.perf_counter() - started, calls)
+
+
+def iterate(stage: str, iterable: Iterable[_T]) -> Iterator[_T]:
+    """Yields the items of the iterable, recording the time spent producing them as one call to
+    the given stage.
+    """
+    iterator = iter(iterable)
+    while True:
+        started = start()
+        try:
+            item = next(iterator)
+        except StopIteration:
+            stop(stage, started)
+            return
+        stop(stage, started, calls=0)
+        yield item
+
+
+def collect() -> dict[str, tuple[float, int]]:
+    """Returns the total time in seconds and number of calls recorded for each stage so far, and
+    starts recording anew.
+    """
+    totals = {stage: (seconds, int(calls)) for stage, (seconds, calls) in _totals.items()}
+    _totals.clear()
+    return totals
+
+
+def merge(*all_totals: dict[str, tuple[float, int]]) -> dict[str, tuple[float, int]]:
+    """Combines the totals collected by, for instance, several worker processes."""
+    merged: dict[str, tuple[float, int]] = {}
+    for totals in all_totals:
+        for stage, (seconds, calls) in totals.items():
+            merged_seconds, merged_calls = merged.get(stage, (0.0, 0))
+            merged[stage] = (merged_seconds + seconds, merged_calls + calls)
+    return merged
+
+
+def report(totals: dict[str, tuple[float, int]], output_format: str = "text") -> str:
+    """Formats the given totals, in pipeline order, either as a table or as JSON."""
+    ordered = [(stage, *totals[stage]) for stage in STAGES if stage in totals]
+    if output_format == "json":
+        return json.dumps(
+            {stage: {"seconds": seconds, "calls": calls} for stage, seconds, calls in ordered},
+            indent=4,
+        )
+
+    lines = [f"{'stage':<10}{'calls':>10}{'total (s)':>12}{'per call (ms)':>16}"]
+    for stage, seconds, calls in ordered:
+        lines.append(f"{stage:<10}{calls:>10}{seconds:>12.4f}{seconds * 1000 / calls:>16.4f}")
+    return "\n".join(lines)
+
+
+def start_tracing_memory() -> None:
+    """Starts tracing memory allocations, unless already doing so."""
+    if not tracemalloc.is_tracing():
+        tracemalloc.start()
+
+
+def stop_tracing_memory() -> None:
+    tracemalloc.stop()
+
+
+def reset_peak_memory() -> bool:
+    """Starts measuring the peak memory allocated from now on, returning whether memory is being
+    traced at all.
+    """
+    global _memory_baseline  # noqa: PLW0603
+    if not tracemalloc.is_tracing():
+        return False
+
+    tracemalloc.reset_peak()
+    _memory_baseline = tracemalloc.get_traced_memory()[0]
+    return True
+
+
+def peak_memory() -> int:
+    """Returns the peak memory, in bytes, allocated since `reset_peak_memory` was last called."""
+    return tracemalloc.get_traced_memory()[1] - _memory_baseline
+
+
+def peak_rss() -> int | None:
+    """Returns the peak resident memory of the current process in bytes, if it can be determined
+    on this platform.
+    """
+    try:
+        import resource  # noqa: PLC0415
+    except ImportError:  # pragma: no cover - not available on Windows
+        return None
+
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # The peak is reported in bytes on macOS, but in kilobytes elsewhere.
+    return max_rss if sys.platform == "darwin" else max_rss * 1024
+
+
+def memory_report(
+    file_peaks: list[tuple[str, int]],
+    peak_rss_by_process: dict[int, int | None],
+    threshold: float,
+    largest: int = 10,
+) -> str:
+    """Formats the peak resident memory of every process, along with the files that needed the
+    most memory to sort and those that needed more than the given threshold in bytes.
+    """
+    lines = [f"{'process':<10}{'peak RSS (MB)':>16}"]
+    for process_id, process_peak in sorted(peak_rss_by_process.items()):
+        peak = "unknown" if process_peak is None else f"{process_peak / 1024 / 1024:.1f}"
+        lines.append(f"{process_id:<10}{peak:>16}")
+
+    by_peak = sorted(file_peaks, key=lambda file_peak: -file_peak[1])
+    lines.append(f"\n{'peak traced (MB)':>16}  file")
+    for file_name, file_peak in by_peak[:largest]:
+        lines.append(f"{file_peak / 1024 / 1024:>16.2f}  {file_name}")
+
+    over_threshold = [file_name for file_name, file_peak in by_peak if file_peak > threshold]
+    lines.append(
+        f"\n{len(over_threshold)} file(s) needed more than {threshold / 1024 / 1024:g} MB to sort"
+        + (":" if over_threshold else ".")
+    )
+    lines.extend(f"  {file_name}" for file_name in over_threshold)
+    return "\n".join(lines)
+
+
+def _record(stage: str, seconds: float, calls: int = 1) -> None:
+    totals = _totals.setdefault(stage, [0.0, 0])
+    totals[0] += seconds
+    totals[1] += calls
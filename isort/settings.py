@@ -3,20 +3,19 @@
 Defines how the default settings for isort should be loaded
 """
 
-import configparser
 import fnmatch
+import hashlib
+import json
 import os
 import posixpath
 import re
 import stat
-import subprocess  # nosec # Needed for gitignore support.
 import sys
 from collections.abc import Callable, Iterable
-from dataclasses import asdict, dataclass, field
-from importlib.metadata import EntryPoints
+from dataclasses import asdict, dataclass, field, fields
 from pathlib import Path
 from re import Pattern
-from typing import Any
+from typing import TYPE_CHECKING, Any
 from warnings import warn
 
 from mypy_extensions import mypyc_attr
@@ -32,19 +31,29 @@ from .exceptions import (
 from .profiles import profiles as profiles
 from .sections import DEFAULT as SECTION_DEFAULTS
 from .sections import FIRSTPARTY, FUTURE, LOCALFOLDER, STDLIB, THIRDPARTY
-from .utils import Trie
+from .utils import PatternMatcher, Trie
 from .wrap_modes import WrapModes
 from .wrap_modes import from_string as wrap_mode_from_string
 
-if sys.version_info >= (3, 11):
-    import tomllib
-else:
-    from ._vendored import tomli as tomllib
+if TYPE_CHECKING:
+    from importlib.metadata import EntryPoints
 
 _SHEBANG_RE = re.compile(rb"^#!.*\bpython[23w]?\b")
 CYTHON_EXTENSIONS = frozenset({"pyx", "pxd"})
 SUPPORTED_EXTENSIONS = frozenset({"py", "pyi", *CYTHON_EXTENSIONS})
 BLOCKED_EXTENSIONS = frozenset({"pex"})
+# Files with these extensions are common in Python projects but are never Python scripts, so they
+# aren't opened to look for a Python shebang.
+NEVER_SNIFF_EXTENSIONS = frozenset(
+    {
+        *("cfg", "csv", "ini", "ipynb", "json", "lock", "log", "md", "rst", "toml", "txt"),
+        *("xml", "yaml", "yml", "css", "htm", "html", "js", "map", "ts"),
+        *("bmp", "gif", "ico", "jpeg", "jpg", "png", "svg", "webp", "eot", "ttf", "woff", "woff2"),
+        *("bz2", "egg", "gz", "jar", "tar", "whl", "xz", "zip"),
+        *("a", "dll", "dylib", "o", "pyc", "pyd", "pyo", "so"),
+        *("c", "cpp", "h", "hpp", "mo", "po", "pot", "db", "npy", "npz", "pkl", "sqlite"),
+    }
+)
 FILE_SKIP_COMMENTS: tuple[str, ...] = (
     "isort:" + "skip_file",
     "isort: " + "skip_file",
@@ -52,7 +61,7 @@ FILE_SKIP_COMMENTS: tuple[str, ...] = (
 MAX_CONFIG_SEARCH_DEPTH: int = 25  # The number of parent directories to for a config file within
 STOP_CONFIG_SEARCH_ON_DIRS: tuple[str, ...] = (".git", ".hg")
 VALID_PY_TARGETS: tuple[str, ...] = tuple(
-    target.replace("py", "") for target in dir(stdlibs) if not target.startswith("_")
+    target.replace("py", "") for target in sorted(stdlibs.NAMES)
 )
 CONFIG_SOURCES: tuple[str, ...] = (
     ".isort.cfg",
@@ -107,6 +116,11 @@ KNOWN_SECTION_MAPPING: dict[str, str] = {
 
 RUNTIME_SOURCE = "runtime"
 
+# Settings that don't influence how imports are sorted and are therefore left out of Config.digest
+_UNDIGESTED_SETTINGS = frozenset(
+    ("sources", "git_ls_files", "use_cache", "cache_dir", "cache_max_entries")
+)
+
 _STR_BOOLEAN_MAPPING = {
     "y": True,
     "yes": True,
@@ -213,6 +227,8 @@ class _Config:
     treat_all_comments_as_code: bool = False
     supported_extensions: frozenset[str] = SUPPORTED_EXTENSIONS
     blocked_extensions: frozenset[str] = BLOCKED_EXTENSIONS
+    never_sniff_extensions: frozenset[str] = NEVER_SNIFF_EXTENSIONS
+    extend_never_sniff_extensions: frozenset[str] = frozenset()
     constants: frozenset[str] = frozenset()
     classes: frozenset[str] = frozenset()
     variables: frozenset[str] = frozenset()
@@ -235,6 +251,9 @@ class _Config:
     sort_order: str = "natural"
     sort_reexports: bool = False
     split_on_trailing_comma: bool = False
+    use_cache: bool = False
+    cache_dir: str = ""
+    cache_max_entries: int = 100_000
 
     def __post_init__(self) -> None:
         py_version = self.py_version
@@ -253,7 +272,7 @@ class _Config:
 
         if not self.known_standard_library:
             object.__setattr__(
-                self, "known_standard_library", frozenset(getattr(stdlibs, self.py_version).stdlib)
+                self, "known_standard_library", frozenset(stdlibs.get(self.py_version).stdlib)
             )
 
         if self.multi_line_output == WrapModes.VERTICAL_GRID_GROUPED_NO_COMMA:
@@ -288,12 +307,16 @@ class Config(_Config):
         **config_overrides: Any,
     ):
         self._known_patterns: list[tuple[Pattern[str], str]] | None = None
+        self._known_pattern_matcher: PatternMatcher | None = None
         self._section_comments: tuple[str, ...] | None = None
         self._section_comments_end: tuple[str, ...] | None = None
         self._skips: frozenset[str] | None = None
         self._posix_skips: frozenset[str] | None = None
         self._skip_globs: frozenset[str] | None = None
+        self._skip_glob_matcher: Pattern[str] | None = None
         self._sorting_function: Callable[..., list[str]] | None = None
+        self._filetypes_by_extension: dict[str, bool | None] = {}
+        self._digest: str | None = None
 
         if config:
             config_vars = asdict(config).copy()
@@ -494,17 +517,56 @@ class Config(_Config):
 
         super().__init__(sources=tuple(sources), **combined_config)
 
-    def is_supported_filetype(self, file_name: str) -> bool:
-        _root, ext = os.path.splitext(file_name)
-        ext = ext.lstrip(".")
-        if ext in self.supported_extensions:
-            return True
-        if ext in self.blocked_extensions:
-            return False
+    def __hash__(self) -> int:
+        return hash(self.digest)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Config):
+            return NotImplemented
+        return self is other or self.digest == other.digest
+
+    def __getstate__(self) -> dict[str, Any]:
+        # Only the digest is worth shipping along, all other derived values are cheaper to
+        # recompute on the receiving side than they are to serialize.
+        state = self.__dict__.copy()
+        state.update(
+            _known_patterns=None,
+            _known_pattern_matcher=None,
+            _section_comments=None,
+            _section_comments_end=None,
+            _skips=None,
+            _posix_skips=None,
+            _skip_globs=None,
+            _skip_glob_matcher=None,
+            _sorting_function=None,
+            _filetypes_by_extension={},
+        )
+        return state
 
-        # Skip editor backup files.
-        if file_name.endswith("~"):
-            return False
+    @property
+    def digest(self) -> str:
+        """A canonical fingerprint of every setting that influences how imports are sorted.
+
+        Equal configurations produce the same digest regardless of how, where, or in which
+        process they were constructed, making it suitable as a key for caches.
+        """
+        if self._digest is not None:
+            return self._digest
+
+        settings = {
+            setting.name: getattr(self, setting.name)
+            for setting in fields(_Config)
+            if setting.name not in _UNDIGESTED_SETTINGS
+        }
+        self._digest = hashlib.sha256(
+            json.dumps(settings, sort_keys=True, default=_canonical).encode("utf-8")
+        ).hexdigest()
+        return self._digest
+
+    def is_supported_filetype(self, file_name: str) -> bool:
+        supported = self.is_supported_file_name(file_name)
+        if supported is not None:
+            return supported
 
         try:
             if stat.S_ISFIFO(os.stat(file_name).st_mode):
@@ -519,7 +581,35 @@ class Config(_Config):
             return False
         return bool(_SHEBANG_RE.match(line))
 
+    def is_supported_file_name(self, file_name: str) -> bool | None:
+        """Returns whether the file type is supported going by its name alone, or None if the file
+        has to be opened to look for a Python shebang.
+        """
+        # Skip editor backup files.
+        if file_name.endswith("~"):
+            return False
+
+        ext = os.path.splitext(file_name)[1].lstrip(".")
+        try:
+            return self._filetypes_by_extension[ext]
+        except KeyError:
+            pass
+
+        supported: bool | None = None
+        if ext in self.supported_extensions:
+            supported = True
+        elif (
+            ext in self.blocked_extensions
+            or ext in self.never_sniff_extensions
+            or ext in self.extend_never_sniff_extensions
+        ):
+            supported = False
+        self._filetypes_by_extension[ext] = supported
+        return supported
+
     def _check_folder_git_ls_files(self, folder: str) -> Path | None:
+        import subprocess  # nosec # noqa: PLC0415 # Needed for gitignore support.
+
         env = {**os.environ, "LANG": "C.UTF-8"}
         try:
             topfolder_result = subprocess.check_output(  # nosec # skipcq: PYL-W1510
@@ -556,12 +646,23 @@ class Config(_Config):
         }
         return git_folder
 
-    def is_skipped(self, file_path: Path) -> bool:
-        """Returns True if the file and/or folder should be skipped based on current settings."""
-        if self.directory and Path(self.directory) in file_path.resolve().parents:
-            file_name = os.path.relpath(file_path.resolve(), self.directory)
-        else:
-            file_name = str(file_path)
+    def is_skipped(
+        self, file_path: Path, check_gitignore: bool = True, resolved_path: Path | None = None
+    ) -> bool:
+        """Returns True if the file and/or folder should be skipped based on current settings.
+
+        Setting `check_gitignore` to `False` leaves out the `skip_gitignore` check, for callers
+        that filter ignored files in bulk themselves. Callers that already know a path exists and
+        where it resolves to, such as directory walkers, can pass that as `resolved_path`.
+        """
+        known_to_exist = resolved_path is not None
+        file_name = str(file_path)
+        if self.directory:
+            # A cheaper equivalent of checking `Path(self.directory) in resolved_path.parents`.
+            directory_prefix = os.path.join(str(Path(self.directory)), "")
+            resolved_name = str(resolved_path or file_path.resolve())
+            if os.path.normcase(resolved_name).startswith(os.path.normcase(directory_prefix)):
+                file_name = resolved_name[len(directory_prefix) :]
 
         os_path = str(file_path)
 
@@ -571,9 +672,8 @@ class Config(_Config):
             normalized_path = normalized_path[2:]
         normalized_path = posixpath.abspath(normalized_path)
 
-        for skip_path in self.posix_skips:
-            if normalized_path == skip_path:
-                return True
+        if normalized_path in self.posix_skips:
+            return True
 
         position = os.path.split(file_name)
         while position[1]:
@@ -581,14 +681,22 @@ class Config(_Config):
                 return True
             position = os.path.split(position[0])
 
-        for sglob in self.skip_globs:
-            if fnmatch.fnmatch(file_name, sglob) or fnmatch.fnmatch("/" + file_name, sglob):
+        if self.skip_globs:
+            normalized_name = os.path.normcase(file_name)
+            if self.skip_glob_matcher.match(normalized_name) or self.skip_glob_matcher.match(
+                os.path.normcase("/") + normalized_name
+            ):
                 return True
 
-        if not (os.path.isfile(os_path) or os.path.isdir(os_path) or os.path.islink(os_path)):
-            return True
+        if not known_to_exist:
+            try:
+                mode = os.lstat(os_path).st_mode
+            except (OSError, ValueError):
+                return True
+            if not (stat.S_ISREG(mode) or stat.S_ISDIR(mode) or stat.S_ISLNK(mode)):
+                return True
 
-        if self.skip_gitignore:
+        if self.skip_gitignore and check_gitignore:
             if file_path.name == ".git":  # pragma: no cover
                 return True
 
@@ -618,7 +726,8 @@ class Config(_Config):
         if self._known_patterns is not None:
             return self._known_patterns
 
-        self._known_patterns = []
+        # Built up separately, so that other threads never see a partial list of patterns.
+        all_known_patterns: list[tuple[Pattern[str], str]] = []
         pattern_sections = [STDLIB] + [section for section in self.sections if section != STDLIB]
         for placement in reversed(pattern_sections):
             known_placement = KNOWN_SECTION_MAPPING.get(placement, placement).lower()
@@ -633,10 +742,24 @@ class Config(_Config):
             ]
             for known_pattern in known_patterns:
                 regexp = "^" + known_pattern.replace("*", ".*").replace("?", ".?") + "$"
-                self._known_patterns.append((re.compile(regexp), placement))
+                all_known_patterns.append((re.compile(regexp), placement))
 
+        self._known_patterns = all_known_patterns
         return self._known_patterns
 
+    @property
+    def known_pattern_matcher(self) -> PatternMatcher:
+        """Matches module names against all known patterns for the configured sections at once."""
+        if self._known_pattern_matcher is not None:
+            return self._known_pattern_matcher
+
+        self._known_pattern_matcher = PatternMatcher(
+            (pattern, placement)
+            for pattern, placement in self.known_patterns
+            if placement in self.sections
+        )
+        return self._known_pattern_matcher
+
     @property
     def section_comments(self) -> tuple[str, ...]:
         if self._section_comments is not None:
@@ -680,6 +803,21 @@ class Config(_Config):
         self._skip_globs = self.skip_glob.union(self.extend_skip_glob)
         return self._skip_globs
 
+    @property
+    def skip_glob_matcher(self) -> Pattern[str]:
+        """Matches paths against all skip globs at once, the way `fnmatch.fnmatch` would."""
+        if self._skip_glob_matcher is not None:
+            return self._skip_glob_matcher
+
+        self._skip_glob_matcher = re.compile(
+            "|".join(
+                f"(?:{fnmatch.translate(os.path.normcase(skip_glob))})"
+                for skip_glob in sorted(self.skip_globs)
+            )
+            or "(?!)"
+        )
+        return self._skip_glob_matcher
+
     @property
     def sorting_function(self) -> Callable[..., list[str]]:
         if self._sorting_function is not None:
@@ -717,6 +855,24 @@ class Config(_Config):
         return patterns
 
 
+def _canonical(value: object) -> object:
+    """Converts setting values that aren't natively JSON serializable into a canonical form."""
+    if isinstance(value, (set, frozenset)):
+        return sorted(map(str, value))
+    if isinstance(value, WrapModes):
+        return value.name
+    if isinstance(value, Path):
+        return str(value)
+    if callable(value):
+        name = f"{getattr(value, '__module__', '')}.{getattr(value, '__qualname__', repr(value))}"
+        # Lambdas and functions defined within other functions don't have a unique name, so
+        # they're told apart by identity instead.
+        if "<lambda>" in name or "<locals>" in name:
+            return f"{name} at {id(value):#x}"
+        return name
+    raise TypeError(f"Unserializable object {value} of type {type(value)}")
+
+
 def _get_str_to_type_converter(setting_name: str) -> Callable[[object], object]:
     type_converter: Callable[[object], object] = type(_DEFAULT_SETTINGS.get(setting_name, ""))
     if type_converter == WrapModes:
@@ -812,7 +968,13 @@ def find_all_configs(path: str) -> Trie:
 def _get_config_data(file_path: str, sections: tuple[str, ...]) -> dict[str, object]:
     settings: dict[str, object] = {}
 
+    # The parsers are imported here, as they aren't needed at all when no config file is found.
     if file_path.endswith(".toml"):
+        if sys.version_info >= (3, 11):
+            import tomllib  # noqa: PLC0415
+        else:
+            from ._vendored import tomli as tomllib  # noqa: PLC0415
+
         with open(file_path, "rb") as bin_config_file:
             config = tomllib.load(bin_config_file)
         for section in sections:
@@ -821,6 +983,8 @@ def _get_config_data(file_path: str, sections: tuple[str, ...]) -> dict[str, obj
                 config_section = config_section.get(key, {})
             settings.update(config_section)
     else:
+        import configparser  # noqa: PLC0415
+
         with open(file_path, encoding="utf-8") as config_file:
             if file_path.endswith(".editorconfig"):
                 line = "\n"
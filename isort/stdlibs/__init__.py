@@ -1,8 +1,15 @@
-from . import all as _all
-from . import py2, py3, py27, py36, py37, py38, py39, py310, py311, py312, py313, py314, py315
+"""Standard library module tables for every supported Python version.
 
-__all__ = (
-    "_all",
+Each table is only imported when first requested through `get`, as most runs need just the one
+matching the configured `py_version`.
+"""
+
+import importlib
+from types import ModuleType
+
+# The tables available, named after the Python version they list the standard library of.
+NAMES: tuple[str, ...] = (
+    "all",
     "py2",
     "py3",
     "py27",
@@ -17,3 +24,10 @@ __all__ = (
     "py314",
     "py315",
 )
+
+
+def get(name: str) -> ModuleType:
+    """Returns the table with the given name, such as `py311`, importing it if needed."""
+    if name not in NAMES:
+        raise ValueError(f"There is no standard library table named {name!r}.")
+    return importlib.import_module(f"{__name__}.{name}")
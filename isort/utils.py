@@ -1,8 +1,16 @@
 import os
+import re
 import sys
+from collections.abc import Iterable
 from functools import lru_cache
 from pathlib import Path
-from typing import Any
+from re import Pattern
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .settings import Config
+
+_LITERAL_PATTERN = re.compile(r"\^(\w+)\$")
 
 
 class TrieNode:
@@ -12,6 +20,7 @@ class TrieNode:
 
         self.nodes: dict[str, TrieNode] = {}
         self.config_info: tuple[str, dict[str, Any]] = (config_file, config_data)
+        self.config: Config | None = None
 
 
 class Trie:
@@ -22,6 +31,8 @@ class Trie:
 
     def __init__(self, config_file: str = "", config_data: dict[str, Any] | None = None) -> None:
         self.root: TrieNode = TrieNode(config_file, config_data)
+        # The Config used for files without any config file above them.
+        self._default_config: Config | None = None
 
     def insert(self, config_file: str, config_data: dict[str, Any]) -> None:
         resolved_config_path_as_tuple = Path(config_file).parent.resolve().parts
@@ -35,28 +46,102 @@ class Trie:
             temp = temp.nodes[path]
 
         temp.config_info = (config_file, config_data)
+        temp.config = None
 
     def search(self, filename: str) -> tuple[str, dict[str, Any]]:
         """
         Returns the closest config relative to filename by doing a depth
         first search on the prefix tree.
         """
+        node = self._search_node(filename)
+        return node.config_info if node else ("", {})
+
+    def search_config(self, filename: str) -> tuple[str, "Config"]:
+        """
+        Returns the path of the closest config relative to filename, along with the Config
+        built from it. Each Config is only built once, no matter how many files it applies to.
+        """
+        from .settings import Config  # noqa: PLC0415 - settings depends on this module
+
+        node = self._search_node(filename)
+        if not node:
+            if self._default_config is None:
+                self._default_config = Config()
+            return "", self._default_config
+
+        if node.config is None:
+            node.config = Config(**node.config_info[1])
+        return node.config_info[0], node.config
+
+    def _search_node(self, filename: str) -> TrieNode | None:
         resolved_file_path_as_tuple = Path(filename).resolve().parts
 
         temp = self.root
 
-        last_stored_config: tuple[str, dict[str, Any]] = ("", {})
+        last_stored_node: TrieNode | None = None
 
         for path in resolved_file_path_as_tuple:
             if temp.config_info[0]:
-                last_stored_config = temp.config_info
+                last_stored_node = temp
 
             if path not in temp.nodes:
                 break
 
             temp = temp.nodes[path]
 
-        return last_stored_config
+        return last_stored_node
+
+
+class PatternMatcher:
+    """
+    Matches names against an ordered collection of anchored patterns, returning the first one
+    that matches alongside its associated value. Literal patterns are looked up in a dict and all
+    others are combined into a single alternation, so each match costs one lookup and one search
+    regardless of how many patterns there are.
+    """
+
+    def __init__(self, patterns: Iterable[tuple[Pattern[str], str]]) -> None:
+        self.literals: dict[str, tuple[int, Pattern[str], str]] = {}
+        self.wildcards: list[tuple[int, Pattern[str], str]] = []
+        for index, (pattern, value) in enumerate(patterns):
+            literal = _LITERAL_PATTERN.fullmatch(pattern.pattern)
+            if literal and not pattern.flags & re.IGNORECASE:
+                self.literals.setdefault(literal.group(1), (index, pattern, value))
+            else:
+                self.wildcards.append((index, pattern, value))
+
+        self.combined: Pattern[str] | None = None
+        if self.wildcards:
+            try:
+                self.combined = re.compile(
+                    "|".join(
+                        f"(?P<_{position}>{pattern.pattern})"
+                        for position, (_, pattern, _) in enumerate(self.wildcards)
+                    )
+                )
+            except re.error:  # pragma: no cover - patterns that can't be combined are tried in turn
+                self.combined = None
+
+    def match(self, name: str) -> tuple[Pattern[str], str] | None:
+        literal = self.literals.get(name)
+        wildcard = self._match_wildcard(name)
+        if literal and (not wildcard or literal[0] < wildcard[0]):
+            return (literal[1], literal[2])
+        if wildcard:
+            return (wildcard[1], wildcard[2])
+        return None
+
+    def _match_wildcard(self, name: str) -> tuple[int, Pattern[str], str] | None:
+        if self.combined is not None:
+            found = self.combined.match(name)
+            if found and found.lastgroup:
+                return self.wildcards[int(found.lastgroup[1:])]
+            return None
+
+        for wildcard in self.wildcards:  # pragma: no cover
+            if wildcard[1].match(name):
+                return wildcard
+        return None
 
 
 @lru_cache(maxsize=1000)
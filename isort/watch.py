@@ -0,0 +1,309 @@
+"""Watches files and directories for changes, as used by `--watch` to keep sorting files as they
+are edited from a single long running process, with configuration and caches kept warm.
+
+Changes are reported by inotify on Linux, falling back to periodically scanning the watched paths
+elsewhere or when inotify can't be used. Bursts of changes, such as editors saving several files
+or tools synchronising whole trees, are coalesced into a single batch.
+"""
+
+import os
+import select
+import struct
+import sys
+import time
+from collections.abc import Callable, Iterable, Iterator
+from pathlib import Path
+from typing import Any, NamedTuple
+
+from isort import files, place
+from isort.settings import Config
+
+# Changes are collected until none were seen for this long, so that bursts are handled together.
+DEBOUNCE_SECONDS = 0.1
+# How often the watched paths are scanned for changes when inotify isn't available.
+POLL_INTERVAL_SECONDS = 0.5
+
+_IN_CLOSE_WRITE = 0x8
+_IN_MOVED_FROM = 0x40
+_IN_MOVED_TO = 0x80
+_IN_CREATE = 0x100
+_IN_DELETE = 0x200
+_IN_Q_OVERFLOW = 0x4000
+_IN_IGNORED = 0x8000
+_IN_ISDIR = 0x40000000
+_IN_CLOEXEC = 0o2000000
+_WATCH_MASK = _IN_CLOSE_WRITE | _IN_MOVED_FROM | _IN_MOVED_TO | _IN_CREATE | _IN_DELETE
+# The watch descriptor, mask, cookie and name length starting every inotify event.
+_EVENT_HEADER = struct.Struct("iIII")
+
+
+class Changes(NamedTuple):
+    # The files written to since the last changes were reported.
+    files: set[str]
+    # Whether source files or directories were added or removed, which can change where modules
+    # are placed.
+    structure_changed: bool
+
+
+class PollingWatcher:
+    """Reports changes by comparing the modification time and size of every file found within the
+    watched paths against the previous scan.
+    """
+
+    def __init__(self, paths: Iterable[str], config: Config) -> None:
+        self.paths = list(paths)
+        self.config = config
+        self._snapshot = self._scan()
+
+    def wait(self, timeout: float | None) -> Changes:
+        """Waits up to timeout seconds, or indefinitely if None, for the next changes."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            snapshot = self._scan()
+            changed = {
+                path
+                for path, signature in snapshot.items()
+                if self._snapshot.get(path) != signature
+            }
+            structure_changed = snapshot.keys() != self._snapshot.keys()
+            self._snapshot = snapshot
+            if changed or structure_changed:
+                return Changes(changed, structure_changed)
+
+            interval = POLL_INTERVAL_SECONDS
+            if deadline is not None:
+                interval = min(interval, deadline - time.monotonic())
+                if interval <= 0:
+                    return Changes(set(), False)
+            time.sleep(interval)
+
+    def close(self) -> None:
+        pass
+
+    def _scan(self) -> dict[str, tuple[int, int]]:
+        snapshot: dict[str, tuple[int, int]] = {}
+        for file_path in files.find(self.paths, self.config, [], []):
+            signature = _signature(os.fspath(file_path))
+            if signature is not None:
+                snapshot[os.path.abspath(file_path)] = signature
+        return snapshot
+
+
+class InotifyWatcher:
+    """Reports changes as notified by the Linux kernel through inotify, watching every directory
+    within the watched paths that isn't skipped.
+    """
+
+    def __init__(self, paths: Iterable[str], config: Config, libc: Any) -> None:
+        self.paths = list(paths)
+        self.config = config
+        self._libc = libc
+        self._fd = libc.inotify_init1(os.O_NONBLOCK | _IN_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(_errno(), "Unable to initialize inotify")
+
+        # The directory each watch descriptor belongs to, along with whether all files within it
+        # are watched, or only the files passed in explicitly.
+        self._directories: dict[int, tuple[str, bool]] = {}
+        self._explicit_files: set[str] = set()
+        try:
+            for path in self.paths:
+                absolute_path = os.path.abspath(path)
+                if os.path.isdir(absolute_path):
+                    self._add_tree(absolute_path, strict=True)
+                else:
+                    self._explicit_files.add(absolute_path)
+                    self._add_watch(os.path.dirname(absolute_path), whole=False, strict=True)
+        except OSError:
+            self.close()
+            raise
+
+    def wait(self, timeout: float | None) -> Changes:
+        """Waits up to timeout seconds, or indefinitely if None, for the next changes."""
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        if not ready:
+            return Changes(set(), False)
+
+        try:
+            data = os.read(self._fd, 65536)
+        except BlockingIOError:  # pragma: no cover - the events were already read
+            return Changes(set(), False)
+
+        changed: set[str] = set()
+        structure_changed = False
+        offset = 0
+        while offset < len(data):
+            watch_descriptor, mask, _, length = _EVENT_HEADER.unpack_from(data, offset)
+            offset += _EVENT_HEADER.size
+            name = os.fsdecode(data[offset : offset + length].rstrip(b"\0"))
+            offset += length
+
+            if mask & _IN_Q_OVERFLOW:  # pragma: no cover - events were lost, check everything
+                all_files = files.find(self.paths, self.config, [], [])
+                return Changes({os.path.abspath(path) for path in all_files}, True)
+            if mask & _IN_IGNORED:
+                self._directories.pop(watch_descriptor, None)
+                continue
+
+            directory, whole = self._directories.get(watch_descriptor, ("", False))
+            if not (directory and name):
+                continue
+
+            path = os.path.join(directory, name)
+            if mask & _IN_ISDIR:
+                if whole and mask & (_IN_CREATE | _IN_MOVED_TO):
+                    changed.update(self._add_tree(path))
+                structure_changed = True
+            elif whole or path in self._explicit_files:
+                if mask & (_IN_CREATE | _IN_DELETE | _IN_MOVED_FROM) and (
+                    os.path.splitext(name)[1][1:] in self.config.supported_extensions
+                ):
+                    structure_changed = True
+                if mask & (_IN_CLOSE_WRITE | _IN_MOVED_TO) and self._is_watched_file(path):
+                    changed.add(path)
+        return Changes(changed, structure_changed)
+
+    def close(self) -> None:
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+    def _is_watched_file(self, path: str) -> bool:
+        if path in self._explicit_files:
+            return True
+        try:
+            return self.config.is_supported_filetype(path) and not self.config.is_skipped(
+                Path(path)
+            )
+        except OSError:  # pragma: no cover - removed again in the meantime
+            return False
+
+    def _add_tree(self, directory: str, strict: bool = False) -> list[str]:
+        """Watches the directory and every directory within it that isn't skipped, returning the
+        files found along the way.
+        """
+        found: list[str] = []
+        pending = [directory]
+        while pending:
+            current = pending.pop()
+            self._add_watch(current, whole=True, strict=strict)
+            try:
+                with os.scandir(current) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=self.config.follow_links):
+                            if not self.config.is_skipped(Path(entry.path)):
+                                pending.append(entry.path)
+                        elif self._is_watched_file(entry.path):
+                            found.append(entry.path)
+            except OSError:
+                continue
+        return found
+
+    def _add_watch(self, directory: str, whole: bool, strict: bool) -> None:
+        watch_descriptor = self._libc.inotify_add_watch(
+            self._fd, os.fsencode(directory), _WATCH_MASK
+        )
+        if watch_descriptor < 0:
+            # Running out of watches for the initial paths means falling back to polling, while
+            # directories created later are simply left unwatched.
+            if strict:
+                raise OSError(_errno(), f"Unable to watch {directory}")
+            return
+
+        _, already_whole = self._directories.get(watch_descriptor, ("", False))
+        self._directories[watch_descriptor] = (directory, whole or already_whole)
+
+
+Watcher = InotifyWatcher | PollingWatcher
+
+
+def create_watcher(paths: Iterable[str], config: Config, polling: bool = False) -> Watcher:
+    """Returns an inotify based watcher for the given paths when available, otherwise one that
+    polls for changes.
+    """
+    paths = list(paths)
+    libc = None if polling else _inotify()
+    if libc is not None:
+        try:
+            return InotifyWatcher(paths, config, libc)
+        except OSError:
+            pass
+    return PollingWatcher(paths, config)
+
+
+def batches(watcher: Watcher, debounce: float = DEBOUNCE_SECONDS) -> Iterator[Changes]:
+    """Yields the changes reported by the watcher, waiting until none were reported for the
+    debounce period before yielding the changes seen until then as one batch.
+    """
+    while True:
+        batch = watcher.wait(None)
+        while True:
+            changes = watcher.wait(debounce)
+            if not (changes.files or changes.structure_changed):
+                break
+            batch.files.update(changes.files)
+            batch = Changes(batch.files, batch.structure_changed or changes.structure_changed)
+        if batch.files or batch.structure_changed:
+            yield batch
+
+
+def watch(
+    paths: Iterable[str],
+    config: Config,
+    on_change: Callable[[list[str]], None],
+    debounce: float = DEBOUNCE_SECONDS,
+    polling: bool = False,
+) -> None:
+    """Calls on_change with each batch of files changed within the given paths, until interrupted.
+
+    Files that haven't changed since on_change last handled them, such as those just rewritten by
+    it, are left out of the following batches.
+    """
+    signatures: dict[str, tuple[int, int] | None] = {}
+    watcher = create_watcher(paths, config, polling=polling)
+    try:
+        for changes in batches(watcher, debounce):
+            if changes.structure_changed:
+                place.clear_caches()
+
+            changed = [
+                file_path
+                for file_path in sorted(changes.files)
+                if (signature := _signature(file_path)) is not None
+                and signatures.get(file_path) != signature
+            ]
+            if changed:
+                on_change(changed)
+                signatures.update((file_path, _signature(file_path)) for file_path in changed)
+    finally:
+        watcher.close()
+
+
+def _signature(file_path: str) -> tuple[int, int] | None:
+    try:
+        stat = os.stat(file_path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _inotify() -> Any:
+    if not sys.platform.startswith("linux"):
+        return None
+
+    import ctypes  # noqa: PLC0415
+    import ctypes.util  # noqa: PLC0415
+
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        libc.inotify_init1.argtypes = [ctypes.c_int]
+        libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+    except (OSError, AttributeError):  # pragma: no cover - a C library without inotify
+        return None
+    return libc
+
+
+def _errno() -> int:
+    import ctypes  # noqa: PLC0415
+
+    return ctypes.get_errno()
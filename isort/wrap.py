@@ -2,6 +2,7 @@ import copy
 import re
 from collections.abc import Sequence
 
+from . import profiling
 from .settings import DEFAULT_CONFIG, Config
 from .wrap_modes import WrapModes as Modes
 from .wrap_modes import formatter_from_string, vertical_hanging_indent
@@ -17,6 +18,7 @@ def import_statement(
     explode: bool = False,
 ) -> str:
     """Returns a multi-line wrapped form of the provided from import statement."""
+    started = profiling.start()
     if explode:
         formatter = vertical_hanging_indent
         line_length = 1
@@ -64,7 +66,8 @@ def import_statement(
             )
             lines = new_import_statement.split(line_separator)
     if statement.count(line_separator) == 0:
-        return _wrap_line(statement, line_separator, config)
+        statement = _wrap_line(statement, line_separator, config)
+    profiling.stop("wrap", started)
     return statement
 
 
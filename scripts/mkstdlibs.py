@@ -1,4 +1,6 @@
 #!/usr/bin/env python3
+import ast
+import glob
 import re
 
 from stdlibs import py38, py39, py310, py311, py312, py313, py314, py315
@@ -38,3 +40,19 @@ for version_module in VERSIONS:
         for module in sorted(version_module.module_names):
             stdlib_file.write(f'    "{module}",\n')
         stdlib_file.write("}\n")
+
+# Python 3 as a whole gets a precomputed table of its own, as it is the default target version and
+# combining the per version tables at import time would mean loading every one of them.
+py3_stdlib: set[str] = set()
+for path in sorted(glob.glob(PATH.format("3*"))):
+    if path != PATH.format("3"):
+        with open(path) as stdlib_file:
+            py3_stdlib.update(ast.literal_eval(stdlib_file.read().split("stdlib = ", 1)[1]))
+
+with open(PATH.format("3"), "w") as stdlib_file:
+    docstring = DOCSTRING.replace("of Python {}", "of every supported Python 3 version combined")
+    stdlib_file.write(f'"""{docstring}"""\n\n')
+    stdlib_file.write("stdlib = {\n")
+    for module in sorted(py3_stdlib):
+        stdlib_file.write(f'    "{module}",\n')
+    stdlib_file.write("}\n")
@@ -0,0 +1,34 @@
+"""Throughput measurements shared by the benchmarks."""
+
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+
+
+@pytest.fixture
+def measure(benchmark) -> Callable[..., None]:
+    """Benchmarks the given function, recording its throughput in files and megabytes per second
+    along with the peak memory allocated by a single run.
+    """
+
+    def measure(
+        function: Callable[[], Any], files: int, size: int, rounds: int = 5, iterations: int = 1
+    ) -> None:
+        benchmark.pedantic(function, rounds=rounds, iterations=iterations)
+        if benchmark.stats is None:  # Benchmarks are disabled, only checking that they run.
+            return
+
+        mean = benchmark.stats.stats.mean
+        benchmark.extra_info["files_per_second"] = files / mean
+        benchmark.extra_info["megabytes_per_second"] = size / mean / 1_000_000
+
+        tracemalloc.start()
+        try:
+            function()
+            benchmark.extra_info["peak_memory_bytes"] = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    return measure
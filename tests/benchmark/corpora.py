@@ -0,0 +1,62 @@
+"""Synthetic and real world corpora for the benchmarks."""
+
+from pathlib import Path
+from typing import Any
+
+# isort's own source code serves as a real world corpus.
+ISORT_SOURCE = Path(__file__).parents[2] / "isort"
+
+
+def large_file(size: int = 5_000) -> str:
+    """Returns a module with the given number of straight and from imports, mixed with comments,
+    followed by some code.
+    """
+    lines = []
+    for index in reversed(range(size)):
+        if index % 3 == 0:
+            lines.append(f"from package_{index % 50}.module_{index} import name_{index}\n")
+        elif index % 7 == 0:
+            lines.append(f"import module_{index}  # comment {index}\n")
+        else:
+            lines.append(f"import module_{index}\n")
+    return "".join(lines) + "\n\ndef function():\n    return module_1\n"
+
+
+def wide_from_imports(modules: int = 50, names: int = 100) -> str:
+    """Returns a module importing many names from each of the given number of modules."""
+    return "".join(
+        f"from module_{module} import "
+        + ", ".join(f"name_{name}" for name in reversed(range(names)))
+        + "\n"
+        for module in reversed(range(modules))
+    )
+
+
+def deeply_nested(depth: int = 20, imports: int = 20) -> str:
+    """Returns a module with import blocks at each level of nested classes and functions."""
+    lines: list[str] = []
+    for level in range(depth):
+        indent = "    " * level
+        lines.extend(
+            f"{indent}import level_{level}_module_{index}\n" for index in reversed(range(imports))
+        )
+        lines.append(f"{indent}{'class' if level % 2 else 'def'} scope_{level}():\n")
+    lines.append(f"{'    ' * depth}pass\n")
+    return "".join(lines)
+
+
+def many_sections(sections: int = 20, imports: int = 50) -> tuple[str, dict[str, Any]]:
+    """Returns a module whose imports belong to many custom sections, along with the config
+    options defining them.
+    """
+    names = [f"SECTION_{index}" for index in range(sections)]
+    code = "".join(
+        f"import section_{section}_module_{index}\n"
+        for index in reversed(range(imports))
+        for section in reversed(range(sections))
+    )
+    config = {
+        "sections": ("FUTURE", "STDLIB", *names, "THIRDPARTY", "FIRSTPARTY", "LOCALFOLDER"),
+        **{f"known_{name.lower()}": [f"section_{index}_*"] for index, name in enumerate(names)},
+    }
+    return code, config
@@ -0,0 +1,33 @@
+import timeit
+from io import StringIO
+
+import pytest
+
+from isort import core
+from isort.settings import Config
+
+
+def _import_block(size: int) -> str:
+    return "".join(f"import module_{index}\n" for index in reversed(range(size)))
+
+
+def _process(code: str, config: Config) -> None:
+    core.process(StringIO(code), StringIO(), config=config)
+
+
+@pytest.mark.parametrize("size", [1_000, 10_000])
+def test_process_large_import_block(benchmark, size) -> None:
+    code = _import_block(size)
+    benchmark.pedantic(_process, args=(code, Config()), rounds=5)
+
+
+@pytest.mark.parametrize("config", [Config(), Config(float_to_top=True)])
+def test_process_scales_linearly(config) -> None:
+    def fastest_run(size: int) -> float:
+        code = _import_block(size)
+        return min(timeit.repeat(lambda: _process(code, config), number=1, repeat=3))
+
+    small, large = 2_000, 16_000
+    # Sorting is O(n log n), so allow generous headroom over the 8x input growth while still
+    # failing for quadratic accumulation, which would take around 64x as long.
+    assert fastest_run(large) < fastest_run(small) * (large / small) * 3
@@ -0,0 +1,78 @@
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+
+from isort import api
+from isort.settings import Config
+from isort.wrap_modes import WrapModes
+
+from .corpora import ISORT_SOURCE, deeply_nested, large_file, many_sections, wide_from_imports
+
+SYNTHETIC_CORPORA: dict[str, tuple[str, dict[str, Any]]] = {
+    "large_file": (large_file(), {}),
+    "wide_from_imports": (wide_from_imports(), {}),
+    "deeply_nested": (deeply_nested(), {}),
+    "many_sections": many_sections(),
+}
+
+
+def _sort_all(codes: list[str], config: Config) -> Callable[[], None]:
+    def sort_all() -> None:
+        for code in codes:
+            api.sort_code_string(code, config=config)
+
+    return sort_all
+
+
+@pytest.mark.parametrize("corpus", SYNTHETIC_CORPORA)
+def test_sort_synthetic(measure, corpus) -> None:
+    code, options = SYNTHETIC_CORPORA[corpus]
+    measure(_sort_all([code], Config(**options)), files=1, size=len(code.encode()))
+
+
+def test_sort_real_world(measure) -> None:
+    codes = [path.read_text(encoding="utf-8") for path in ISORT_SOURCE.rglob("*.py")]
+    measure(
+        _sort_all(codes, Config(profile="black")),
+        files=len(codes),
+        size=sum(len(code.encode()) for code in codes),
+    )
+
+
+def test_sort_code_strings_real_world(measure) -> None:
+    codes = [path.read_text(encoding="utf-8") for path in ISORT_SOURCE.rglob("*.py")]
+    config = Config(profile="black")
+
+    def sort_all() -> None:
+        for _ in api.sort_code_strings(((code, None) for code in codes), config=config):
+            pass
+
+    measure(sort_all, files=len(codes), size=sum(len(code.encode()) for code in codes))
+
+
+@pytest.mark.parametrize(
+    "options",
+    [{"float_to_top": True}, {"force_sort_within_sections": True}],
+    ids=lambda options: next(iter(options)),
+)
+def test_sort_options(measure, options) -> None:
+    code = large_file()
+    measure(_sort_all([code], Config(**options)), files=1, size=len(code.encode()))
+
+
+@pytest.mark.parametrize("mode", list(WrapModes), ids=lambda mode: mode.name)
+def test_wrap_modes(measure, mode) -> None:
+    code = wide_from_imports(modules=20)
+    config = Config(multi_line_output=mode, line_length=79)
+    measure(_sort_all([code], config), files=1, size=len(code.encode()))
+
+
+def test_find_imports_in_paths(measure) -> None:
+    paths = list(ISORT_SOURCE.rglob("*.py"))
+
+    def find_imports() -> None:
+        for _ in api.find_imports_in_paths(iter([ISORT_SOURCE])):
+            pass
+
+    measure(find_imports, files=len(paths), size=sum(path.stat().st_size for path in paths))
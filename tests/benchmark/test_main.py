@@ -0,0 +1,25 @@
+import pytest
+
+from isort import main
+
+FILES = 2_000
+CONTENT = "import os\nimport sys\n\nfrom package import a, b, c\n"
+
+
+@pytest.fixture(scope="module")
+def project(tmp_path_factory):
+    project = tmp_path_factory.mktemp("project")
+    for package in range(FILES // 100):
+        package_path = project / f"package_{package}"
+        package_path.mkdir()
+        for module in range(100):
+            (package_path / f"module_{module}.py").write_text(CONTENT)
+    return project
+
+
+@pytest.mark.parametrize("jobs", [1, 2, 4])
+def test_jobs_scaling(measure, project, jobs) -> None:
+    arguments = [str(project), "--settings-path", str(project), "--check-only", "--quiet"]
+    if jobs > 1:
+        arguments += ["--jobs", str(jobs)]
+    measure(lambda: main.main(arguments), files=FILES, size=FILES * len(CONTENT), rounds=3)
@@ -0,0 +1,72 @@
+import subprocess
+import sys
+
+import pytest
+
+
+def _import_time(module: str) -> int:
+    """Returns the cumulative time, in microseconds, spent importing the given module."""
+    import_times = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stderr
+    for line in import_times.splitlines():
+        _, _, cumulative, name = (part.strip() for part in line.replace("|", ":").split(":"))
+        if name == module:
+            return int(cumulative)
+    raise AssertionError(f"{module} was not imported")
+
+
+@pytest.mark.parametrize("module", ["isort.stdlibs", "isort.settings"])
+def test_import_time(benchmark, module) -> None:
+    benchmark.extra_info["import_time_us"] = benchmark.pedantic(
+        _import_time, args=(module,), rounds=5
+    )
+
+
+# Modules that aren't needed to check or sort files using only the default configuration. Each of
+# them noticeably adds to the startup time of every run, which dominates the latency of editors
+# that run isort whenever a file is saved.
+DEFERRED_MODULES = (
+    "concurrent.futures",
+    "configparser",
+    "difflib",
+    "isort.literal",
+    "isort.stdlibs.all",
+    "subprocess",
+    "tomllib",
+)
+
+
+def test_startup_defers_unneeded_modules(tmp_path) -> None:
+    source = tmp_path / "source.py"
+    source.write_text("import os\nimport sys\n")
+    loaded_modules = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys\n"
+            "from isort.main import main\n"
+            "try:\n"
+            f"    main(['--check-only', '--settings-path', {str(tmp_path)!r}, {str(source)!r}])\n"
+            "finally:\n"
+            "    print(*sys.modules)",
+        ],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout.split()
+    assert not set(DEFERRED_MODULES).intersection(loaded_modules)
+
+
+def test_check_startup(benchmark, tmp_path) -> None:
+    source = tmp_path / "source.py"
+    source.write_text("import os\nimport sys\n")
+    benchmark.pedantic(
+        subprocess.run,
+        args=([sys.executable, "-m", "isort", "--check-only", str(source)],),
+        kwargs={"check": True, "capture_output": True},
+        rounds=5,
+    )
@@ -0,0 +1,57 @@
+import asyncio
+
+import pytest
+
+from isort import aio, api
+from isort._version import _IS_COMPILED
+from isort.settings import Config
+
+CODES = [f"import sys\nimport os\nimport module{index}\n" for index in range(20)]
+
+
+@pytest.mark.parametrize("use_threads", [True, False], ids=["threads", "processes"])
+def test_sorter(use_threads: bool) -> None:
+    async def run() -> tuple[list[str], list[bool], list[str]]:
+        async with aio.Sorter(
+            workers=2, max_concurrency=3, use_threads=use_threads, force_single_line=True
+        ) as sorter:
+            sorted_codes = await asyncio.gather(*(sorter.sort_code_string(code) for code in CODES))
+            checks = await asyncio.gather(
+                sorter.check_code_string(CODES[0]), sorter.check_code_string(sorted_codes[0])
+            )
+            imports = await sorter.find_imports_in_code("from a import b, c\n")
+        return sorted_codes, list(checks), [found.statement() for found in imports]
+
+    sorted_codes, checks, statements = asyncio.run(run())
+    assert sorted_codes == [
+        api.sort_code_string(code, config=Config(force_single_line=True)) for code in CODES
+    ]
+    assert checks == [False, True]
+    assert statements == ["from a import b", "from a import c"]
+
+
+@pytest.mark.skipif(reason="Can't use these mocks in mypyc-compiled code.", condition=_IS_COMPILED)
+def test_sorter_bounds_concurrency() -> None:
+    async def run() -> int:
+        sorter = aio.Sorter(workers=4, max_concurrency=2, use_threads=True)
+        running = 0
+        most_running = 0
+        call = sorter._thread_worker.call
+
+        def counted_call(*args, **kwargs):
+            nonlocal running, most_running
+            running += 1
+            most_running = max(most_running, running)
+            try:
+                return call(*args, **kwargs)
+            finally:
+                running -= 1
+
+        sorter._thread_worker.call = counted_call  # type: ignore[method-assign]
+        try:
+            await asyncio.gather(*(sorter.sort_code_string(code) for code in CODES))
+        finally:
+            sorter.close()
+        return most_running
+
+    assert 1 <= asyncio.run(run()) <= 2
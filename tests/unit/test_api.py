@@ -7,6 +7,7 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from isort import ImportKey, api
+from isort.io import File
 from isort.settings import Config
 
 imperfect_content = "import b\nimport a\n"
@@ -114,3 +115,82 @@ import x
     assert len(list(api.find_imports_in_code(code, unique=ImportKey.ATTRIBUTE))) == 3
     assert len(list(api.find_imports_in_code(code, unique=ImportKey.MODULE))) == 2
     assert len(list(api.find_imports_in_code(code, unique=ImportKey.PACKAGE))) == 1
+
+
+def test_nothing_to_sort(tmpdir) -> None:
+    no_imports = tmpdir.join("constants.py")
+    no_imports.write_text("VALUE = 1\n", "utf8")
+    with File.read(str(no_imports)) as source_file:
+        assert api._nothing_to_sort(source_file, Config())
+        assert not api._nothing_to_sort(source_file, Config(add_imports=["import os"]))
+        assert api._nothing_to_sort(
+            source_file, Config(add_imports=["import os"], append_only=True)
+        )
+        assert not api._nothing_to_sort(source_file, Config(atomic=True))
+    with patch("isort.api.core.process") as process:
+        assert not api.sort_file(no_imports)
+        assert api.check_file(no_imports)
+        process.assert_not_called()
+    assert api.sort_file(no_imports, add_imports=["import os"])
+    assert no_imports.read() == "import os\n\nVALUE = 1\n"
+
+    empty = tmpdir.join("empty.py")
+    empty.write_text("", "utf8")
+    with File.read(str(empty)) as source_file:
+        assert api._nothing_to_sort(source_file, Config())
+
+    for code in ("import os\n", "x = [1]  # isort: skip_file\n", "__all__ = ('b', 'a')\n"):
+        needs_processing = tmpdir.join("needs_processing.py")
+        needs_processing.write_text(code, "utf8")
+        with File.read(str(needs_processing)) as source_file:
+            assert not api._nothing_to_sort(source_file, Config(sort_reexports=True))
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_sort_code_strings(tmp_path, jobs) -> None:
+    (tmp_path / ".isort.cfg").write_text(
+        "[settings]\nforce_single_line = true\nskip = skipped.py\n"
+    )
+    (tmp_path / "configured.py").write_text("")
+    (tmp_path / "skipped.py").write_text("")
+    items = [
+        (imperfect_content, None),
+        ("from a import c, b\n", tmp_path / "configured.py"),
+        (imperfect_content, tmp_path / "skipped.py"),
+        *((f"import b{index}\nimport a\n", None) for index in range(40)),
+    ]
+    results = list(api.sort_code_strings(iter(items), jobs=jobs))
+    assert results[:3] == [
+        (0, fixed_content),
+        (1, "from a import b\nfrom a import c\n"),
+        (2, imperfect_content),
+    ]
+    assert results[3:] == [
+        (index, api.sort_code_string(code)) for index, (code, _) in enumerate(items) if index > 2
+    ]
+
+    unordered = list(
+        api.sort_code_strings(items, jobs=jobs, ordered=False, force_single_line=False)
+    )
+    assert sorted(unordered) == list(
+        enumerate(
+            api.sort_code_string(code, force_single_line=False) if index != 2 else code
+            for index, (code, _) in enumerate(items)
+        )
+    )
+
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_check_files(tmpdir, imperfect, jobs) -> None:
+    perfect = tmpdir.join("perfect.py")
+    perfect.write_text(fixed_content, "utf8")
+    filenames = [str(imperfect), str(perfect)]
+    assert list(api.check_files(filenames, jobs=jobs)) == [
+        (str(imperfect), False),
+        (str(perfect), True),
+    ]
+    assert sorted(
+        api.check_files(filenames, jobs=jobs, ordered=False, force_sort_within_sections=True)
+    ) == sorted([(str(imperfect), False), (str(perfect), True)])
+    with pytest.raises(ValueError, match="You can either specify custom configuration options"):
+        list(api.check_files(filenames, config=Config(), line_length=10, jobs=jobs))
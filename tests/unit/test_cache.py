@@ -0,0 +1,118 @@
+import os
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+from isort import api, cache, main, place
+from isort.settings import Config
+
+
+def test_file_key(tmp_path: Path):
+    config = Config(use_cache=True, cache_dir=str(tmp_path / "cache"), directory=str(tmp_path))
+    source = tmp_path / "source.py"
+    source.write_text("import a\nimport b\n")
+
+    key = cache.file_key(source, config)
+    assert key == cache.file_key(source, config)
+    assert key != cache.file_key(source, Config(config=config, line_length=100))
+    assert key != cache.file_key(source, config, extension="pyi")
+    assert key == cache.file_key(source, Config(config=config, cache_max_entries=1))
+
+    source.write_text("import a\nimport c\n")
+    assert key != cache.file_key(source, config)
+
+    # Adding a module to the src_paths can change whether imports of it are sorted.
+    key = cache.file_key(source, config)
+    (tmp_path / "c.py").write_text("")
+    place.clear_caches()
+    assert key != cache.file_key(source, config)
+
+    assert cache.file_key(tmp_path / "missing.py", config) is None
+
+
+def test_is_sorted_and_mark_sorted(tmp_path: Path):
+    config = Config(use_cache=True, cache_dir=str(tmp_path / "cache"))
+    assert not cache.is_sorted("abcdef", config)
+    cache.mark_sorted("abcdef", config)
+    assert cache.is_sorted("abcdef", config)
+    assert (tmp_path / "cache" / "ab" / "abcdef").exists()
+
+
+def test_default_directory(tmp_path: Path, monkeypatch):
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    assert cache.directory(Config()) == tmp_path / "isort"
+    assert cache.directory(Config(cache_dir="elsewhere")) == Path("elsewhere")
+
+
+def test_prune(tmp_path: Path):
+    config = Config(use_cache=True, cache_dir=str(tmp_path / "cache"), cache_max_entries=2)
+    cache.prune(config)  # Doesn't fail when the cache directory doesn't exist yet.
+
+    for age, key in enumerate(("aa1", "aa2", "bb3", "bb4")):
+        cache.mark_sorted(key, config)
+        timestamp = 1_000_000 + age
+        os.utime(cache.directory(config) / key[:2] / key, (timestamp, timestamp))
+
+    cache.prune(config)
+    assert not cache.is_sorted("aa1", config)
+    assert not cache.is_sorted("aa2", config)
+    assert cache.is_sorted("bb3", config)
+    assert cache.is_sorted("bb4", config)
+
+
+def test_prune_if_due(tmp_path: Path):
+    config = Config(use_cache=True, cache_dir=str(tmp_path / "cache"), cache_max_entries=1)
+    cache.mark_sorted("aa1", config)
+    cache.mark_sorted("aa2", config)
+    cache.prune_if_due(config)
+    assert len(list((tmp_path / "cache" / "aa").iterdir())) == 1
+
+    # Pruned recently, so it isn't done again yet.
+    cache.mark_sorted("aa3", config)
+    cache.prune_if_due(config)
+    assert len(list((tmp_path / "cache" / "aa").iterdir())) == 2
+
+    pruned_at = time.time() - cache.PRUNE_INTERVAL_SECONDS
+    os.utime(tmp_path / "cache" / "last-pruned", (pruned_at, pruned_at))
+    cache.prune_if_due(config)
+    assert len(list((tmp_path / "cache" / "aa").iterdir())) == 1
+
+
+def test_check_file_uses_cache(tmp_path: Path, capsys):
+    config = Config(use_cache=True, cache_dir=str(tmp_path / "cache"), verbose=True)
+    source = tmp_path / "source.py"
+    source.write_text("import a\nimport b\n")
+
+    assert api.check_file(source, config=config)
+    with patch("isort.api.check_stream") as check_stream:
+        assert api.check_file(source, config=config)
+        check_stream.assert_not_called()
+    assert "Everything Looks Good!" in capsys.readouterr().out
+
+    source.write_text("import b\nimport a\n")
+    assert not api.check_file(source, config=config)
+    assert not api.check_file(source, config=config)
+
+
+def test_sort_file_uses_cache(tmp_path: Path):
+    config = Config(use_cache=True, cache_dir=str(tmp_path / "cache"))
+    source = tmp_path / "source.py"
+    source.write_text("import b\nimport a\n")
+
+    assert api.sort_file(source, config=config)
+    assert not api.sort_file(source, config=config)
+    with patch("isort.api.sort_stream") as sort_stream:
+        assert not api.sort_file(source, config=config)
+        sort_stream.assert_not_called()
+    assert source.read_text() == "import a\nimport b\n"
+
+
+def test_main_with_cache(tmp_path: Path, capsys):
+    source = tmp_path / "source.py"
+    source.write_text("import b\nimport a\n")
+    cache_dir = tmp_path / "cache"
+
+    main.main([str(source), "--cache", "--cache-dir", str(cache_dir), "--cache-max-entries", "1"])
+    main.main([str(source), "--cache", "--cache-dir", str(cache_dir), "--check-only"])
+    assert source.read_text() == "import a\nimport b\n"
+    assert len(list(cache_dir.glob("*/*"))) == 1
@@ -0,0 +1,121 @@
+import http.client
+import socket
+import sys
+import threading
+
+import pytest
+
+from isort import daemon
+
+UNSORTED = "import sys\nimport os\n"
+SORTED = "import os\nimport sys\n"
+
+
+@pytest.fixture
+def server():
+    server = daemon.make_server("localhost", 0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _post(server, path, body, headers=None):
+    connection = http.client.HTTPConnection("localhost", server.server_address[1], timeout=10)
+    try:
+        connection.request("POST", path, body=body.encode("utf-8"), headers=headers or {})
+        response = connection.getresponse()
+        return response.status, response.read().decode("utf-8")
+    finally:
+        connection.close()
+
+
+def test_sort(server):
+    assert _post(server, "/sort", UNSORTED) == (200, SORTED)
+    assert _post(server, "/sort", SORTED) == (204, "")
+
+
+def test_check(server):
+    assert _post(server, "/check", UNSORTED) == (409, "")
+    assert _post(server, "/check", SORTED) == (204, "")
+
+
+def test_config_overrides(server):
+    code = "from a import b, c\n"
+    single_line = "from a import b\nfrom a import c\n"
+    assert _post(server, "/sort", code) == (204, "")
+    assert _post(server, "/sort", code, {daemon.CONFIG_HEADER: '{"force_single_line": true}'}) == (
+        200,
+        single_line,
+    )
+    assert _post(server, "/sort", code, {daemon.CONFIG_HEADER: "[not json"})[0] == 400
+    assert _post(server, "/sort", code, {daemon.CONFIG_HEADER: '{"apply": true}'})[0] == 400
+
+
+def test_file_path(server, tmp_path):
+    (tmp_path / ".isort.cfg").write_text("[settings]\nskip=skipped.py\nforce_single_line=1\n")
+    source = tmp_path / "source.py"
+    source.write_text("")
+    code = "from a import b, c\n"
+    assert _post(server, "/sort", code, {daemon.FILE_PATH_HEADER: str(source)}) == (
+        200,
+        "from a import b\nfrom a import c\n",
+    )
+    assert _post(
+        server, "/check", UNSORTED, {daemon.FILE_PATH_HEADER: str(tmp_path / "skipped.py")}
+    ) == (204, "")
+
+
+def test_negative_content_length(server):
+    assert _post(server, "/sort", "", {"Content-Length": "-1"})[0] == 400
+
+
+def test_unknown_charset(server):
+    assert _post(server, "/sort", UNSORTED, {"Content-Type": "text/plain; charset=bogus"})[0] == 400
+
+
+def test_placements_expire(server, tmp_path, monkeypatch):
+    (tmp_path / ".isort.cfg").write_text("[settings]\nsrc_paths=.\n")
+    source = tmp_path / "source.py"
+    source.write_text("")
+    code = "import isortd_module\nimport requests\n"
+    headers = {daemon.FILE_PATH_HEADER: str(source)}
+    assert _post(server, "/sort", code, headers) == (204, "")
+
+    (tmp_path / "isortd_module.py").write_text("")
+    assert _post(server, "/sort", code, headers) == (204, "")
+
+    monkeypatch.setattr(daemon, "PLACEMENT_CACHE_SECONDS", 0)
+    assert _post(server, "/sort", code, headers) == (
+        200,
+        "import requests\n\nimport isortd_module\n",
+    )
+
+
+def test_unknown_path(server):
+    assert _post(server, "/unknown", SORTED)[0] == 404
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="Unix sockets aren't available on Windows")
+def test_unix_socket(tmp_path):
+    socket_path = str(tmp_path / "isortd.sock")
+    server = daemon.make_server(socket_path=socket_path)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.connect(socket_path)
+            client.sendall(
+                b"POST /sort HTTP/1.0\r\nContent-Length: %d\r\n\r\n%s"
+                % (len(UNSORTED), UNSORTED.encode("utf-8"))
+            )
+            response = b""
+            while chunk := client.recv(4096):
+                response += chunk
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert response.startswith(b"HTTP/1.0 200")
+    assert response.endswith(SORTED.encode("utf-8"))
@@ -1,8 +1,135 @@
+import os
+import subprocess
+
+import pytest
+
 from isort import files
-from isort.settings import DEFAULT_CONFIG
+from isort.exceptions import ChangedFilesUnavailable
+from isort.settings import DEFAULT_CONFIG, Config
+
+from .utils import git
 
 
 def test_find(tmpdir):
     tmp_file = tmpdir.join("file.py")
     tmp_file.write("import os, sys\n")
     assert tuple(files.find((tmp_file,), DEFAULT_CONFIG, [], [])) == (tmp_file,)
+
+
+def test_git_ignore_filter(tmp_path):
+    project = tmp_path / "project"
+    nested = project / "nested"
+    nested.mkdir(parents=True)
+    for repository in (project, nested):
+        subprocess.run(["git", "init", "-q", str(repository)], check=True)
+    (project / ".gitignore").write_text("ignored*.py\n!ignored_but_kept.py\n")
+    (nested / ".gitignore").write_text("generated.py\n")
+    (tmp_path / "outside.py").write_text("")
+    paths = [
+        project / "kept.py",
+        project / "ignored.py",
+        project / "ignored_but_kept.py",
+        nested / "generated.py",
+        nested / "ignored.py",
+        project / "link.py",
+        tmp_path / "outside.py",
+    ]
+    for path in paths[:-2]:
+        path.write_text("")
+    if os.name != "nt":
+        paths[5].symlink_to(tmp_path / "outside.py")
+    else:  # pragma: no cover
+        paths[5].write_text("")
+
+    gitignore_filter = files.GitIgnoreFilter()
+    try:
+        assert gitignore_filter.ignored([str(path) for path in paths]) == [
+            False,
+            True,
+            False,
+            True,
+            False,
+            os.name != "nt",
+            False,
+        ]
+        assert gitignore_filter.ignored([]) == []
+    finally:
+        gitignore_filter.close()
+
+
+def test_find_skip_gitignore(tmp_path):
+    subprocess.run(["git", "init", "-q", str(tmp_path)], check=True)
+    (tmp_path / ".gitignore").write_text("ignored.py\n")
+    (tmp_path / "kept.py").write_text("")
+    (tmp_path / "ignored.py").write_text("")
+    skipped: list[str] = []
+    config = Config(skip_gitignore=True)
+    assert list(files.find([str(tmp_path)], config, skipped, [])) == [str(tmp_path / "kept.py")]
+    assert skipped == [str(tmp_path / ".git"), str(tmp_path / "ignored.py")]
+
+
+def test_find_walks_like_os_walk(tmp_path):
+    for directory in ("a/b", "a/skipped_dir", "c", "build"):
+        (tmp_path / directory).mkdir(parents=True)
+    for file_name in ("top.py", "a/one.py", "a/b/two.py", "a/skipped.py", "c/three.pyi"):
+        (tmp_path / file_name).write_text("")
+    (tmp_path / "a/skipped_dir/hidden.py").write_text("")
+    (tmp_path / "build/built.py").write_text("")
+    (tmp_path / "c/data.json").write_text("")
+    if os.name != "nt":
+        (tmp_path / "c/loop").symlink_to(tmp_path / "c")
+
+    config = Config(directory=str(tmp_path), skip_glob=["*skipped*"])
+    expected = sorted(
+        os.path.join(dirpath, file_name)
+        for dirpath, dirnames, file_names in os.walk(tmp_path)
+        for file_name in file_names
+        if file_name.endswith((".py", ".pyi"))
+        and "skipped" not in dirpath + file_name
+        and "build" not in dirpath
+    )
+    for jobs in (1, 3):
+        skipped: list[str] = []
+        found = list(files.find([str(tmp_path)], config, skipped, [], jobs=jobs))
+        assert sorted(found) == expected
+        assert sorted(skipped) == sorted(
+            [
+                str(tmp_path / "a/skipped_dir"),
+                str(tmp_path / "a/skipped.py"),
+                str(tmp_path / "build"),
+            ]
+        )
+
+
+def test_changed_since(tmp_path):
+    (tmp_path / "package").mkdir()
+    for file_name in ("unchanged.py", "changed.py", "deleted.py", "package/skipped.py"):
+        (tmp_path / file_name).write_text("import os\n")
+    git(tmp_path, "init", "-q")
+    git(tmp_path, "add", ".")
+    git(tmp_path, "commit", "-q", "-m", "Initial commit")
+
+    for file_name in ("changed.py", "package/skipped.py", "README.md"):
+        (tmp_path / file_name).write_text("import sys\n")
+    (tmp_path / "deleted.py").unlink()
+    (tmp_path / "untracked.py").write_text("")
+    (tmp_path / "intent_to_add.py").write_text("")
+    git(tmp_path, "add", "-N", "intent_to_add.py", "README.md")
+
+    skipped: list[str] = []
+    config = Config(skip=["package"], directory=str(tmp_path))
+    assert sorted(files.changed_since("HEAD", [str(tmp_path)], config, skipped)) == [
+        str(tmp_path / "changed.py"),
+        str(tmp_path / "intent_to_add.py"),
+    ]
+    assert skipped == [str(tmp_path / "package" / "skipped.py")]
+
+    assert list(files.changed_since("HEAD", [str(tmp_path / "package")], Config(), [])) == [
+        str(tmp_path / "package" / "skipped.py")
+    ]
+
+    with pytest.raises(ChangedFilesUnavailable):
+        list(files.changed_since("no-such-ref", [str(tmp_path)], config, []))
+    with pytest.raises(ChangedFilesUnavailable):
+        list(files.changed_since("--output=diff.txt", [str(tmp_path)], config, []))
+    assert not (tmp_path / "diff.txt").exists()
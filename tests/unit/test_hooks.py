@@ -8,6 +8,8 @@ import pytest
 from isort import exceptions, hooks
 from isort._version import _IS_COMPILED
 
+from .utils import git
+
 
 def test_git_hook(src_dir):
     """Simple smoke level testing of git hooks"""
@@ -56,7 +58,7 @@ def test_git_hook(src_dir):
         "subprocess.run",
         side_effect=[
             CompletedProcess("command", returncode=0, stdout=file_name.encode()),
-            CompletedProcess("command", returncode=0, stdout=b"import b,a"),
+            CompletedProcess("command", returncode=0, stdout=b"0123 blob 10\nimport b,a\n"),
         ],
     ) as run_mock:
         errors = hooks.git_hook(modify=True, strict=True)
@@ -72,7 +74,7 @@ def test_git_hook_with_mocks(src_dir: str) -> None:
     mock_main_py = MagicMock(return_value=[os.path.join(src_dir, "main.py")])
 
     mock_imperfect = MagicMock()
-    mock_imperfect.return_value.stdout = b"import b\nimport a"
+    mock_imperfect.return_value.stdout = b"0123 blob 17\nimport b\nimport a\n"
 
     # Test with sorted file returned from git and modify=False
     with patch("isort.hooks.get_lines", mock_main_py):
@@ -85,7 +87,7 @@ def test_git_hook_with_mocks(src_dir: str) -> None:
     with patch("isort.hooks.get_lines", MagicMock(return_value=[os.path.join(src_dir, "main.py")])):
 
         class FakeProcessResponse:
-            stdout = b"# isort: skip-file\nimport b\nimport a\n"
+            stdout = b"0123 blob 37\n# isort: skip-file\nimport b\nimport a\n\n"
 
         with patch("subprocess.run", MagicMock(return_value=FakeProcessResponse())):
             with patch("isort.api", MagicMock(side_effect=exceptions.FileSkipped("", ""))):
@@ -136,8 +138,47 @@ def test_git_hook_uses_the_configuration_file_specified_in_settings_path(tmp_pat
 
     files_modified = [str(modified_file_path.absolute())]
     with patch("isort.hooks.get_lines", MagicMock(return_value=files_modified)):
-        with patch("isort.hooks.get_output", MagicMock(return_value="")):
+        with patch("isort.hooks.get_staged_contents", MagicMock(return_value=[""])):
             with patch("isort.api.check_code_string", MagicMock()) as run_mock:
                 hooks.git_hook(settings_file=str(configuration_file_path))
 
                 assert run_mock.call_args[1]["config"].sections == (section,)
+
+
+def test_get_staged_contents(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    git(tmp_path, "init", "-q")
+    (tmp_path / "a.py").write_text("import os\n")
+    (tmp_path / "b.py").write_text("import sys\n\n")
+    git(tmp_path, "add", "a.py", "b.py")
+    (tmp_path / "a.py").write_text("import unstaged\n")
+
+    monkeypatch.chdir(tmp_path)
+    assert hooks.get_staged_contents(["a.py", "missing.py", "b.py", "not staged.py"]) == [
+        "import os\n",
+        None,
+        "import sys\n\n",
+        None,
+    ]
+
+
+def test_git_hook_checks_in_parallel(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    git(tmp_path, "init", "-q")
+    git(tmp_path, "commit", "-q", "--allow-empty", "-m", "Initial commit")
+    file_count = hooks._PARALLEL_CHECK_MIN_FILES + 4
+    for index in range(file_count):
+        # Every third file is staged unsorted, but sorted on disk.
+        unsorted = index % 3 == 0
+        (tmp_path / f"file{index}.py").write_text(
+            "import b\nimport a\n" if unsorted else "import a\nimport b\n"
+        )
+        git(tmp_path, "add", f"file{index}.py")
+        if unsorted:
+            (tmp_path / f"file{index}.py").write_text("import a\nimport b\n")
+
+    monkeypatch.chdir(tmp_path)
+    expected_errors = len(range(0, file_count, 3))
+    assert hooks.git_hook(strict=True, jobs=2) == expected_errors
+    assert hooks.git_hook(strict=True, jobs=1) == expected_errors
+    assert hooks.git_hook(strict=True, jobs=None) == expected_errors
+    assert hooks.git_hook(strict=False, jobs=2) == 0
+    assert hooks.git_hook(strict=True, lazy=True, jobs=2) == 0
@@ -11,7 +11,9 @@ def test_importable():
     import isort
     import isort._version
     import isort.api
+    import isort.cache
     import isort.comments
+    import isort.daemon
     import isort.exceptions
     import isort.format
     import isort.hooks
@@ -5833,3 +5833,13 @@ def test_builtin_modules() -> None:
         "from python_none_objects import NoneIterable\n"
     )
     assert isort.code(test_input) == test_output
+
+
+def test_float_to_top_line_endings() -> None:
+    assert (
+        isort.code(
+            "import b\r\nx = 1\r\nimport a\r\n# isort: split\r\nimport d\r\nimport c",
+            float_to_top=True,
+        )
+        == "import a\r\nimport b\r\n\r\nx = 1\r\n# isort: split\r\nimport c\r\nimport d\r\n"
+    )
@@ -11,10 +11,10 @@ from hypothesis import given
 from hypothesis import strategies as st
 
 from isort import main
-from isort._version import _VERSION_STRING, _IS_COMPILED
+from isort._version import _IS_COMPILED, get_version_string
 from isort.exceptions import InvalidSettingsPath
 from isort.settings import DEFAULT_CONFIG, Config
-from .utils import as_stream
+from .utils import as_stream, git
 from io import BytesIO, TextIOWrapper
 from typing import TYPE_CHECKING, Any
 
@@ -55,6 +55,145 @@ def test_sort_imports(tmpdir):
     assert main.sort_imports(str(tmp_file), config=skip_config, disregard_skip=False).skipped  # type: ignore # noqa
 
 
+def test_chunk_by_size(tmpdir):
+    small = tmpdir.join("small.py")
+    small.write("x" * 10)
+    large = tmpdir.join("large.py")
+    large.write("x" * 100)
+    missing = str(tmpdir.join("missing.py"))
+    file_names = [str(small), str(large), str(small), missing, str(small), str(small)]
+    assert list(main._chunk_by_size(file_names, chunk_bytes=25, max_files=3)) == [
+        [str(large)],
+        [str(small), str(small), missing],
+        [str(small), str(small)],
+    ]
+    assert list(main._chunk_by_size([])) == []
+
+
+def test_sort_chunk(tmpdir):
+    unsorted = tmpdir.join("unsorted.py")
+    unsorted.write("import os, sys\n")
+    sorted_file = tmpdir.join("sorted.py")
+    sorted_file.write("import os\n")
+    main._init_worker({"config": DEFAULT_CONFIG, "check": True})
+    try:
+        assert main._sort_chunk([str(unsorted), str(sorted_file)]) == [
+            (True, False, True),
+            (False, False, True),
+        ]
+    finally:
+        main._worker_sort_options.clear()
+
+
+@pytest.mark.parametrize("jobs", [[], ["--jobs", "2"]])
+def test_profile_stages(tmpdir, capsys, jobs):
+    for name in ("one.py", "two.py"):
+        tmpdir.join(name).write("import os, sys\n")
+    main.main([str(tmpdir), "--settings-path", str(tmpdir), "--profile-stages", "json", *jobs])
+    totals = json.loads(capsys.readouterr().err)
+    assert totals["find"]["calls"] == 1
+    assert totals["read"]["calls"] == 2
+    assert totals["write"]["calls"] == 2
+
+    main.main([str(tmpdir), "--settings-path", str(tmpdir), "--profile-stages"])
+    assert capsys.readouterr().err.split()[:4] == ["stage", "calls", "total", "(s)"]
+
+
+@pytest.mark.parametrize("jobs", [[], ["--jobs", "2"]])
+def test_profile_memory(tmpdir, capsys, jobs):
+    tmpdir.join("source.py").write("import os, sys\n")
+    main.main([str(tmpdir), "--settings-path", str(tmpdir), "--profile-memory", "0.001", *jobs])
+    err = capsys.readouterr().err
+    assert err.startswith("process")
+    assert "1 file(s) needed more than 0.001 MB to sort:" in err
+    assert str(tmpdir.join("source.py")) in err.splitlines()[-1]
+
+
+@pytest.mark.parametrize("jobs", [[], ["--jobs", "2"]])
+def test_summary_json(tmpdir, jobs):
+    tmpdir.join("unsorted.py").write("import os, sys\nfrom a import b\n")
+    tmpdir.join("sorted.py").write("import os\n")
+    tmpdir.join("skipped.py").write("import os\n")
+    summary_path = tmpdir.join("summary.json")
+    main.main(
+        [
+            str(tmpdir),
+            "--settings-path",
+            str(tmpdir),
+            "--skip",
+            "skipped.py",
+            "--summary-json",
+            str(summary_path),
+            "--summary-slowest",
+            "1",
+            *jobs,
+        ]
+    )
+    summary = json.loads(summary_path.read())
+    assert {key: summary[key] for key in ("processed", "changed", "skipped", "broken")} == {
+        "processed": 2,
+        "changed": 1,
+        "skipped": 1,
+        "broken": 0,
+    }
+    assert summary["bytes_read"] == len("import os, sys\nfrom a import b\nimport os\n")
+    assert summary["seconds"] > 0
+    assert len(summary["slowest"]) == 1
+    assert summary["slowest"][0]["imports"] in (1, 3)
+
+
+@pytest.mark.parametrize("check", [[], ["--check-only"]])
+def test_summary_json_changed(tmpdir, check):
+    tmpdir.join("first.py").write("import sys\nimport os\n")
+    tmpdir.join("second.py").write("import sys\nimport os\n")
+    tmpdir.join("sorted.py").write("import os\n")
+    summary_path = tmpdir.join("summary.json")
+    arguments = [str(tmpdir), "--settings-path", str(tmpdir), "--summary-json", str(summary_path)]
+    if check:
+        with pytest.raises(SystemExit):
+            main.main([*arguments, *check])
+    else:
+        main.main(arguments)
+    summary = json.loads(summary_path.read())
+    assert (summary["processed"], summary["changed"]) == (3, 2)
+
+
+def test_changed_since(tmpdir, capsys):
+    tmpdir.join("unchanged.py").write("import sys\nimport os\n")
+    tmpdir.join("changed.py").write("import os\n")
+    git(tmpdir, "init", "-q")
+    git(tmpdir, "add", ".")
+    git(tmpdir, "commit", "-q", "-m", "Initial commit")
+    tmpdir.join("changed.py").write("import sys\nimport os\n")
+
+    main.main([str(tmpdir), "--settings-path", str(tmpdir), "--changed-since", "HEAD"])
+    assert tmpdir.join("changed.py").read() == "import os\nimport sys\n"
+    assert tmpdir.join("unchanged.py").read() == "import sys\nimport os\n"
+
+    with pytest.raises(SystemExit):
+        main.main([str(tmpdir), "--changed-since", "no-such-ref"])
+    assert "Unable to determine the files changed since no-such-ref" in capsys.readouterr().err
+
+
+@pytest.mark.skipif(reason="Can't use these mocks in mypyc-compiled code.", condition=_IS_COMPILED)
+def test_watch(tmpdir, capsys):
+    tmpdir.join("file.py").write("import sys\nimport os\n")
+
+    def fake_watch(paths, config, on_change):
+        assert paths == [str(tmpdir)]
+        tmpdir.join("file.py").write("import sys\nimport os\n")
+        on_change([str(tmpdir.join("file.py"))])
+        raise KeyboardInterrupt()
+
+    with unittest.mock.patch("isort.watch.watch", side_effect=fake_watch):
+        main.main([str(tmpdir), "--watch"])
+    assert tmpdir.join("file.py").read() == "import os\nimport sys\n"
+    assert "Watching for changes" in capsys.readouterr().out
+
+    with pytest.raises(SystemExit):
+        main.main(["-", "--watch"])
+
+
 @pytest.mark.skipif(reason="Can't use these mocks in mypyc-compiled code.", condition=_IS_COMPILED)
 def test_sort_imports_error_handling(tmpdir, capsys):
     tmp_file = tmpdir.join("file.py")
@@ -103,7 +242,7 @@ def test_ascii_art(capsys):
 
       isort your imports, so you don't have to.
 
-                    VERSION {_VERSION_STRING}
+                    VERSION {get_version_string()}
 
 """
     )
@@ -946,7 +1085,7 @@ import pandas as pd
 
       isort your imports, so you don't have to.
 
-                    VERSION {_VERSION_STRING}
+                    VERSION {get_version_string()}
 
 """
     )
@@ -989,7 +1128,7 @@ import os
 
       isort your imports, so you don't have to.
 
-                    VERSION {_VERSION_STRING}
+                    VERSION {get_version_string()}
 
 """
     )
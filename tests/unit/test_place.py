@@ -56,3 +56,29 @@ def test_namespace_package_placement(examples_path):
         assert place.module("root.nested", config=config) == "FIRSTPARTY"
         assert place.module("root.name", config=manual_namespace) == "THIRDPARTY"
         assert place.module("root.nested", config=config) == "FIRSTPARTY"
+
+
+def test_equal_configs_share_placement_cache(src_path):
+    place.module_with_reason.cache_clear()
+    assert place.module("isort", config=Config(src_paths=[src_path])) == sections.FIRSTPARTY
+    assert place.module("isort", config=Config(src_paths=[src_path])) == sections.FIRSTPARTY
+    assert place.module_with_reason.cache_info().hits == 1
+
+
+def test_src_path_module_index(tmp_path):
+    (tmp_path / "package").mkdir()
+    (tmp_path / "module.py").write_text("")
+    (tmp_path / "data.json").write_text("")
+    (tmp_path / "broken.py").symlink_to(tmp_path / "does_not_exist.py")
+    assert place._module_index(tmp_path) == (
+        frozenset({"package"}),
+        frozenset({"module"}),
+    )
+    assert place._module_index(tmp_path / "does_not_exist") == (frozenset(), frozenset())
+
+    config = Config(src_paths=[tmp_path], directory=str(tmp_path))
+    assert place.module("package", config=config) == sections.FIRSTPARTY
+    assert place.module("module.attribute", config=config) == sections.FIRSTPARTY
+    assert place.module("data", config=config) == sections.THIRDPARTY
+    assert place.module("broken", config=config) == sections.THIRDPARTY
+    assert place.module(tmp_path.name, config=config) == sections.FIRSTPARTY
@@ -0,0 +1,103 @@
+import json
+import tracemalloc
+
+import pytest
+
+from isort import api, place, profiling
+
+
+@pytest.fixture
+def profiled():
+    profiling.enable()
+    try:
+        yield
+    finally:
+        profiling.disable()
+        profiling.collect()
+
+
+def test_enable_and_disable():
+    assert not profiling.start()
+    profiling.stop("parse", profiling.start())
+    profiling.enable()
+    try:
+        profiling.stop("parse", profiling.start())
+        place.clear_caches()
+    finally:
+        profiling.disable()
+    profiling.stop("parse", profiling.start())
+    assert profiling.collect()["parse"][1] == 1
+
+
+def test_iterate(profiled):
+    assert list(profiling.iterate("find", iter(["a.py", "b.py"]))) == ["a.py", "b.py"]
+    assert profiling.collect()["find"][1] == 1
+
+
+def test_stages_are_recorded(profiled, tmpdir):
+    source = tmpdir.join("source.py")
+    source.write("import os, sys\n")
+    api.sort_file(source, atomic=True, overwrite_in_place=True)
+
+    totals = profiling.collect()
+    assert set(totals) == {"config", "read", "parse", "place", "output", "compile", "write"}
+    assert totals["compile"][1] == 2
+    assert totals["place"][1] == 2
+    assert all(seconds >= 0 for seconds, _ in totals.values())
+    assert not profiling.collect()
+
+
+def test_merge_and_report():
+    totals = profiling.merge(
+        {"parse": (1.0, 2), "find": (0.5, 1)}, {"parse": (2.0, 1)}, {"write": (0.25, 5)}
+    )
+    assert totals == {"parse": (3.0, 3), "find": (0.5, 1), "write": (0.25, 5)}
+
+    table = profiling.report(totals).splitlines()
+    assert [line.split()[0] for line in table] == ["stage", "find", "parse", "write"]
+    assert table[2].split() == ["parse", "3", "3.0000", "1000.0000"]
+    assert json.loads(profiling.report(totals, "json")) == {
+        "find": {"seconds": 0.5, "calls": 1},
+        "parse": {"seconds": 3.0, "calls": 3},
+        "write": {"seconds": 0.25, "calls": 5},
+    }
+
+
+def test_peak_memory():
+    assert not profiling.reset_peak_memory()
+    profiling.start_tracing_memory()
+    try:
+        assert profiling.reset_peak_memory()
+        allocated = bytearray(1024 * 1024)
+        assert profiling.peak_memory() >= len(allocated)
+        del allocated
+        assert profiling.reset_peak_memory()
+        assert profiling.peak_memory() < 1024 * 1024
+    finally:
+        tracemalloc.stop()
+
+    peak_rss = profiling.peak_rss()
+    assert peak_rss is None or peak_rss > 1024 * 1024
+
+
+def test_memory_report():
+    megabyte = 1024 * 1024
+    report = profiling.memory_report(
+        [("small.py", megabyte), ("large.py", 3 * megabyte), ("medium.py", 2 * megabyte)],
+        {2: 100 * megabyte, 1: None},
+        threshold=megabyte,
+        largest=2,
+    ).splitlines()
+    assert report == [
+        "process      peak RSS (MB)",
+        "1                  unknown",
+        "2                    100.0",
+        "",
+        "peak traced (MB)  file",
+        "            3.00  large.py",
+        "            2.00  medium.py",
+        "",
+        "2 file(s) needed more than 1 MB to sort:",
+        "  large.py",
+        "  medium.py",
+    ]
@@ -1,4 +1,5 @@
 import os
+import pickle
 import sys
 from pathlib import Path
 
@@ -63,6 +64,27 @@ class TestConfig:
         path.write("#!/usr/bin/env python\n")
         assert self.instance.is_supported_filetype(str(path))
 
+    def test_is_supported_filetype_never_sniff(self, tmpdir):
+        path = tmpdir.join("myscript.cgi")
+        path.write("#!/usr/bin/env python\n")
+        assert self.instance.is_supported_filetype(str(path))
+        assert not Config(never_sniff_extensions=["cgi"]).is_supported_filetype(str(path))
+        assert not Config(extend_never_sniff_extensions=["cgi"]).is_supported_filetype(str(path))
+
+        data = tmpdir.join("data.json")
+        data.write("#!/usr/bin/env python\n")
+        assert not self.instance.is_supported_filetype(str(data))
+        assert not Config(extend_never_sniff_extensions=["cgi"]).is_supported_filetype(str(data))
+        assert Config(never_sniff_extensions=["cgi"]).is_supported_filetype(str(data))
+
+    def test_is_supported_file_name(self):
+        assert self.instance.is_supported_file_name("file.py")
+        assert self.instance.is_supported_file_name("file.pex") is False
+        assert self.instance.is_supported_file_name("file.json") is False
+        assert self.instance.is_supported_file_name("file.py~") is False
+        assert self.instance.is_supported_file_name("myscript") is None
+        assert self.instance.is_supported_file_name("myscript.cgi") is None
+
     def test_is_supported_filetype_editor_backup(self, tmpdir):
         path = tmpdir.join("myscript~")
         path.write("#!/usr/bin/env python\n")
@@ -86,6 +108,21 @@ class TestConfig:
         os.mkfifo(fifo_file)
         assert not self.instance.is_supported_filetype(fifo_file)
 
+    def test_skip_glob_matcher(self, tmp_path):
+        assert not Config().skip_glob_matcher.match("anything.py")
+        config = Config(skip_glob=["*/generated/*", "build_*.py"], extend_skip_glob=["x?.py"])
+        assert config.skip_glob_matcher.match("src/generated/module.py")
+        assert config.skip_glob_matcher.match("build_one.py")
+        assert config.skip_glob_matcher.match("x1.py")
+        assert not config.skip_glob_matcher.match("src/module.py")
+
+        (tmp_path / "generated").mkdir()
+        generated = tmp_path / "generated" / "module.py"
+        generated.write_text("")
+        assert Config(directory=str(tmp_path), skip_glob=["generated/*"]).is_skipped(generated)
+        assert not Config(directory=str(tmp_path)).is_skipped(generated)
+        assert Config(directory=str(tmp_path)).is_skipped(tmp_path / "missing.py")
+
     def test_src_paths_are_combined_and_deduplicated(self):
         src_paths = ["src", "tests"]
         src_full_paths = (Path(os.getcwd()) / f for f in src_paths)
@@ -105,6 +142,45 @@ class TestConfig:
     def test_deprecated_multi_line_output(self):
         assert Config(multi_line_output=6).multi_line_output == WrapModes.VERTICAL_GRID_GROUPED  # noqa
 
+    def test_digest(self):
+        config = Config(profile="black", known_first_party=["one", "two"])
+        same_config = Config(known_first_party=["two", "one"], profile="black")
+        assert config.digest == same_config.digest
+        assert config == same_config
+        assert hash(config) == hash(same_config)
+        assert Config(config=config) == config
+        assert Config(config=config, use_cache=True, cache_dir="elsewhere") == config
+
+        assert Config(config=config, line_length=100) != config
+        assert config.digest != Config(config=config, known_first_party=["one"]).digest
+        assert config != "not a config"
+
+    def test_digest_of_unnamed_callables(self):
+        def format_code(code: str, extension: str, config: object) -> str:
+            return code
+
+        def format_other_code(code: str, extension: str, config: object) -> str:
+            return code.strip()
+
+        assert Config(formatting_function=format_code) == Config(formatting_function=format_code)
+        assert Config(formatting_function=format_code) != Config(
+            formatting_function=format_other_code
+        )
+        assert Config(formatting_function=lambda code, *_: code) != Config(
+            formatting_function=lambda code, *_: code.strip()
+        )
+
+    def test_digest_survives_pickling(self):
+        config = Config(known_third_party=["one"])
+        assert config.known_patterns
+        digest = config.digest
+
+        unpickled = pickle.loads(pickle.dumps(config))
+        assert unpickled._digest == digest
+        assert unpickled._known_patterns is None
+        assert unpickled == config
+        assert set(unpickled.known_patterns) == set(config.known_patterns)
+
 
 def test_as_list():
     assert settings._as_list([" one "]) == ["one"]
@@ -0,0 +1,37 @@
+import subprocess
+import sys
+
+import pytest
+
+from isort import stdlibs
+
+
+def test_tables_are_loaded_on_demand():
+    loaded_modules = subprocess.run(
+        [
+            sys.executable,
+            "-c",
+            "import sys, isort; print(*(name for name in sys.modules if 'stdlibs.' in name))",
+        ],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout.split()
+    assert loaded_modules == ["isort.stdlibs.py3"]
+
+
+def test_combined_tables():
+    assert stdlibs.get("py3").stdlib == set().union(
+        *(
+            stdlibs.get(name).stdlib
+            for name in stdlibs.NAMES
+            if name.startswith("py3") and name != "py3"
+        )
+    )
+    assert stdlibs.get("py2").stdlib == stdlibs.get("py27").stdlib
+    assert stdlibs.get("all").stdlib == stdlibs.get("py2").stdlib | stdlibs.get("py3").stdlib
+
+
+def test_unknown_table():
+    with pytest.raises(ValueError, match="py99"):
+        stdlibs.get("py99")
@@ -1,4 +1,6 @@
-from isort.utils import Trie
+import re
+
+from isort.utils import PatternMatcher, Trie
 
 
 def test_trie():
@@ -36,3 +38,50 @@ def test_trie():
     config_outside = trie_root.search("/temp/file.py")
     assert config_outside[0] == "default"
     assert config_outside[1] == {"line_length": 70}
+
+
+def test_trie_search_config():
+    trie_root = Trie("default", {"line_length": 70})
+    trie_root.insert("/temp/config1/.isort.cfg", {"line_length": 71})
+
+    config_path, config = trie_root.search_config("/temp/config1/subdir/file1.py")
+    assert config_path == "/temp/config1/.isort.cfg"
+    assert config.line_length == 71
+    assert trie_root.search_config("/temp/config1/file2.py")[1] is config
+
+    config_path, default_config = trie_root.search_config("/temp/file.py")
+    assert config_path == "default"
+    assert default_config.line_length == 70
+
+    trie_root.insert("/temp/config1/.isort.cfg", {"line_length": 72})
+    assert trie_root.search_config("/temp/config1/file1.py")[1].line_length == 72
+
+    empty_trie = Trie()
+    config_path, fallback_config = empty_trie.search_config("/temp/file.py")
+    assert config_path == ""
+    assert empty_trie.search_config("/other/file.py")[1] is fallback_config
+
+
+def test_pattern_matcher():
+    patterns = [
+        (re.compile("^requests$"), "THIRDPARTY"),
+        (re.compile("^goo.*$"), "THIRDPARTY"),
+        (re.compile("^google$"), "FIRSTPARTY"),
+        (re.compile("^os$"), "STDLIB"),
+        (re.compile("^os$"), "FIRSTPARTY"),
+        (re.compile("^a.b$"), "FIRSTPARTY"),
+    ]
+    matcher = PatternMatcher(patterns)
+    assert set(matcher.literals) == {"requests", "google", "os"}
+    assert len(matcher.wildcards) == 2
+
+    assert matcher.match("requests") == patterns[0]
+    # The wildcard pattern comes first, so it wins over the literal one.
+    assert matcher.match("google") == patterns[1]
+    assert matcher.match("goose") == patterns[1]
+    # Only the first of two identical patterns is used.
+    assert matcher.match("os") == patterns[3]
+    assert matcher.match("a.b") == patterns[5]
+    assert matcher.match("sys") is None
+
+    assert PatternMatcher([]).match("anything") is None
@@ -0,0 +1,11 @@
+from importlib import metadata
+
+import isort
+from isort import _version
+
+
+def test_version():
+    assert _version.get_version() == metadata.version("isort")
+    assert isinstance(isort.__version__, str)
+    assert isort.__version__ == _version.get_version()
+    assert _version.get_version_string().startswith(f"{_version.get_version()} (compiled ")
@@ -0,0 +1,76 @@
+import threading
+from pathlib import Path
+
+import pytest
+
+from isort import watch
+from isort.settings import Config
+
+
+class _Stop(Exception):
+    pass
+
+
+@pytest.fixture(params=[False, True], ids=["inotify", "polling"])
+def polling(request, monkeypatch) -> bool:
+    monkeypatch.setattr(watch, "POLL_INTERVAL_SECONDS", 0.05)
+    return bool(request.param)
+
+
+def test_watcher(tmp_path: Path, polling: bool) -> None:
+    (tmp_path / "package").mkdir()
+    (tmp_path / "package" / "module.py").write_text("import os\n")
+    (tmp_path / "build").mkdir()
+    config = Config(directory=str(tmp_path))
+    watcher = watch.create_watcher([str(tmp_path)], config, polling=polling)
+    try:
+        if polling:
+            assert isinstance(watcher, watch.PollingWatcher)
+        assert watcher.wait(0.1) == watch.Changes(set(), False)
+
+        (tmp_path / "package" / "module.py").write_text("import sys\nimport os\n")
+        (tmp_path / "build" / "skipped.py").write_text("import os\n")
+        (tmp_path / "README.md").write_text("")
+        assert watcher.wait(5).files == {str(tmp_path / "package" / "module.py")}
+
+        (tmp_path / "package" / "new.py").write_text("import os\n")
+        changes = watcher.wait(5)
+        assert changes.files == {str(tmp_path / "package" / "new.py")}
+        assert changes.structure_changed
+    finally:
+        watcher.close()
+
+
+def test_watch(tmp_path: Path, polling: bool) -> None:
+    paths = [tmp_path / "a.py", tmp_path / "b.py", tmp_path / "c.py"]
+    for path in paths:
+        path.write_text("import os\n")
+    batches: list[list[str]] = []
+
+    def on_change(changed_files: list[str]) -> None:
+        batches.append(changed_files)
+        if len(batches) == 2:
+            raise _Stop()
+
+        # Writing a file while handling it doesn't report it again.
+        Path(changed_files[0]).write_text("import sys\n")
+        paths[2].write_text("import sys\n")
+
+    def edit() -> None:
+        paths[0].write_text("import os\nimport sys\n")
+        paths[1].write_text("import os\nimport sys\n")
+
+    timer = threading.Timer(0.3, edit)
+    timer.start()
+    try:
+        with pytest.raises(_Stop):
+            watch.watch(
+                [str(paths[0]), str(paths[1]), str(paths[2])],
+                Config(),
+                on_change,
+                debounce=0.2,
+                polling=polling,
+            )
+    finally:
+        timer.cancel()
+    assert batches == [[str(paths[0]), str(paths[1])], [str(paths[2])]]
@@ -1,3 +1,5 @@
+import os
+import subprocess
 from io import BytesIO, StringIO, TextIOWrapper
 
 import isort
@@ -28,3 +30,21 @@ def isort_test(code: str, expected_output: str = "", **config):
     assert output == expected_output
 
     assert output == isort.code(output, **config)
+
+
+def git(repository: str | os.PathLike[str], *arguments: str) -> None:
+    """Runs a git command within the given repository, committing as a fixed test user."""
+    subprocess.run(
+        [
+            "git",
+            "-C",
+            os.fspath(repository),
+            "-c",
+            "user.name=isort",
+            "-c",
+            "user.email=isort@test",
+            *arguments,
+        ],
+        check=True,
+        capture_output=True,
+    )